@@ -1,40 +1,82 @@
-import json
+import base64
 
+import orjson
 from src.handlers.auth import is_authorized
 from src.handlers.calculations import calculate_totals
-from src.handlers.expenditures import post_expenditure
+from src.handlers.expenditures import post_expenditure, post_expenditures
+
+
+def _dumps(obj):
+    return orjson.dumps(obj, default=str).decode()
+
+
+# Fixed responses are serialized once; API Gateway never mutates them
+_DENIED_RESP = {"statusCode": 403, "body": _dumps({"message": "Access denied"})}
+_POSTED_RESP = {
+    "statusCode": 200,
+    "body": _dumps({"message": "Expenditure posted successfully"}),
+}
+_POST_FAILED_RESP = {
+    "statusCode": 500,
+    "body": _dumps({"message": "Failed to post expenditure"}),
+}
+_BAD_BATCH_RESP = {
+    "statusCode": 400,
+    "body": _dumps({"message": "expenditures must be a list of objects"}),
+}
+_UNSUPPORTED_RESP = {
+    "statusCode": 400,
+    "body": _dumps({"message": "Unsupported method"}),
+}
 
 
 def lambda_handler(event, context):
     # Check if the user is authorized
-    user_id = event.get("requestContext", {}).get("identity", {}).get("userArn")
-    if not is_authorized(user_id):
-        return {"statusCode": 403, "body": json.dumps({"message": "Access denied"})}
+    identity = (event.get("requestContext") or {}).get("identity") or {}
+    user_id = identity.get("userArn")
+    if not user_id or not is_authorized(user_id):
+        return _DENIED_RESP
 
     # Determine the HTTP method
     http_method = event.get("httpMethod")
 
     if http_method == "POST":
         # Handle posting an expenditure
-        body = json.loads(event.get("body", "{}"))
+        raw = event.get("body")
+        if raw and event.get("isBase64Encoded"):
+            raw = base64.b64decode(raw)
+        body = orjson.loads(raw) if raw else {}
+
+        if "expenditures" in body:
+            # Bulk post: one Sheets append and transactional DynamoDB writes
+            batch = body["expenditures"]
+            if not isinstance(batch, list) or not all(
+                isinstance(exp, dict) for exp in batch
+            ):
+                return _BAD_BATCH_RESP
+            rows = [
+                (
+                    exp.get("child_name"),
+                    exp.get("amount"),
+                    exp.get("date"),
+                    exp.get("description"),
+                )
+                for exp in batch
+            ]
+            return _POSTED_RESP if post_expenditures(rows) else _POST_FAILED_RESP
+
         amount = body.get("amount")
         description = body.get("description")
         date = body.get("date")
 
         if post_expenditure(amount, description, date):
-            return {
-                "statusCode": 200,
-                "body": json.dumps({"message": "Expenditure posted successfully"}),
-            }
+            return _POSTED_RESP
         else:
-            return {
-                "statusCode": 500,
-                "body": json.dumps({"message": "Failed to post expenditure"}),
-            }
+            return _POST_FAILED_RESP
 
     elif http_method == "GET":
         # Handle calculating totals
         totals = calculate_totals()
-        return {"statusCode": 200, "body": json.dumps(totals)}
+        return {"statusCode": 200, "body": _dumps(totals)}
 
-    return {"statusCode": 400, "body": json.dumps({"message": "Unsupported method"})}
+    return _UNSUPPORTED_RESP
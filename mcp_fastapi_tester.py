@@ -4,16 +4,57 @@ Provides intelligent model testing and validation capabilities
 """
 
 import asyncio
-import json
 import sys
-from dataclasses import asdict
+import time
+from dataclasses import fields, is_dataclass
 from datetime import datetime
+from operator import attrgetter
+
+# Fast JSON encoding - orjson handles datetimes natively; fall back to json
+# Resources read by humans are indented, tool output for the LLM is compact
+try:
+    import orjson
+
+    def _dumps(obj, *, pretty: bool = False) -> str:
+        """Serialize to JSON text"""
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+
+except ImportError:
+    import json
+
+    def _json_default(obj):
+        return obj.isoformat() if isinstance(obj, datetime) else str(obj)
+
+    def _dumps(obj, *, pretty: bool = False) -> str:
+        """Serialize to JSON text"""
+        if pretty:
+            return json.dumps(obj, indent=2, default=_json_default)
+        return json.dumps(obj, separators=(",", ":"), default=_json_default)
+
+
+# Reporting timestamps may be up to a second stale; avoids reformatting per read
+_TS_CACHE = [0.0, ""]
+
+
+def _now_iso(ttl: float = 1.0) -> str:
+    """Current local time in ISO format, refreshed at most every ttl seconds"""
+    t = time.monotonic()
+    if t - _TS_CACHE[0] > ttl or not _TS_CACHE[1]:
+        _TS_CACHE[0] = t
+        _TS_CACHE[1] = datetime.now().isoformat()
+    return _TS_CACHE[1]
+
 
 # MCP imports - using the correct API
 try:
+    import anyio
     import mcp.types as types
     from mcp.server import Server
     from mcp.server.stdio import stdio_server
+    from pydantic import AnyUrl
 
     HAS_MCP = True
 except ImportError:
@@ -45,361 +86,529 @@ except ImportError as e:
 # Try to import FastAPI testing tools
 try:
     from fastapi.testclient import TestClient
+    from httpx import ASGITransport, AsyncClient
 
     HAS_FASTAPI_TESTING = True
 except ImportError:
     HAS_FASTAPI_TESTING = False
 
+# Shared TestClient - built on first use and reused across tool calls
+_TEST_CLIENT = None
+
+
+def _get_client():
+    """Return the shared TestClient, creating it on first use"""
+    global _TEST_CLIENT
+    if _TEST_CLIENT is None:
+        _TEST_CLIENT = TestClient(app)
+    return _TEST_CLIENT
+
+
+# Async counterpart used for concurrent live probes
+_ASYNC_CLIENT = None
+
+
+def _get_async_client():
+    """Return the shared AsyncClient, creating it on first use"""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://testserver"
+        )
+    return _ASYNC_CLIENT
+
+
+# Static resource payloads - serialized once at import instead of per read
+_STATUS = {
+    "models_available": HAS_MODELS,
+    "app_available": HAS_APP,
+    "fastapi_testing_available": HAS_FASTAPI_TESTING,
+    "mcp_available": HAS_MCP,
+    "import_error": IMPORT_ERROR if not HAS_MODELS else None,
+    "python_version": sys.version,
+    "testing_capabilities": {
+        "model_validation": HAS_MODELS,
+        "schema_analysis": HAS_MODELS,
+        "endpoint_testing": HAS_FASTAPI_TESTING and HAS_APP,
+        "integration_testing": HAS_MODELS and HAS_FASTAPI_TESTING and HAS_APP,
+    },
+}
+
+# Everything after the opening brace; the timestamp is spliced in per read
+_STATUS_TAIL = _dumps(_STATUS, pretty=True)[1:]
+
+_CHILD_SCHEMA = {
+    "model_name": "Child",
+    "fields": {
+        "id": {
+            "type": "str",
+            "required": True,
+            "description": "Unique identifier",
+        },
+        "name": {
+            "type": "str",
+            "required": True,
+            "description": "Child's name",
+        },
+        "age": {"type": "int", "required": True, "description": "Child's age"},
+        "weekly_allowance": {
+            "type": "float",
+            "required": True,
+            "description": "Weekly allowance amount",
+        },
+        "total_earnings": {
+            "type": "float",
+            "computed": True,
+            "description": "Total earnings calculated",
+        },
+        "expenditures": {
+            "type": "List[Expenditure]",
+            "required": False,
+            "description": "Child's expenditures",
+        },
+    },
+    "methods": ["total_earnings", "add_expenditure"],
+    "validation_rules": {
+        "age": "Must be positive integer",
+        "weekly_allowance": "Must be positive float",
+        "name": "Must be non-empty string",
+    },
+    "relationships": ["expenditures"],
+    "test_data_examples": [
+        {"name": "Alice", "age": 8, "weekly_allowance": 5.0},
+        {"name": "Bob", "age": 12, "weekly_allowance": 10.0},
+        {"name": "Charlie", "age": 6, "weekly_allowance": 3.0},
+    ],
+}
+
+_USER_SCHEMA = {
+    "model_name": "User",
+    "fields": {
+        "email": {
+            "type": "str",
+            "required": True,
+            "description": "User email (primary key)",
+        },
+        "name": {
+            "type": "str",
+            "required": True,
+            "description": "User display name",
+        },
+        "google_id": {
+            "type": "str",
+            "required": True,
+            "description": "Google OAuth ID",
+        },
+        "picture": {
+            "type": "str",
+            "required": False,
+            "description": "Profile picture URL",
+        },
+        "is_active": {
+            "type": "bool",
+            "default": True,
+            "description": "User active status",
+        },
+        "is_admin": {
+            "type": "bool",
+            "default": False,
+            "description": "Admin privileges",
+        },
+        "created_at": {
+            "type": "datetime",
+            "auto": True,
+            "description": "Creation timestamp",
+        },
+    },
+    "validation_rules": {
+        "email": "Must be valid email format",
+        "google_id": "Must be non-empty string",
+        "name": "Must be non-empty string",
+    },
+    "authentication_context": True,
+    "test_data_examples": [
+        {
+            "email": "alice@example.com",
+            "name": "Alice Smith",
+            "google_id": "google123",
+        },
+        {
+            "email": "bob@admin.com",
+            "name": "Bob Admin",
+            "google_id": "google456",
+            "is_admin": True,
+        },
+    ],
+}
+
+_STATIC_RESOURCES: dict[str, str] = (
+    {
+        "fastapi://models/child/schema": _dumps(_CHILD_SCHEMA, pretty=True),
+        "fastapi://models/user/schema": _dumps(_USER_SCHEMA, pretty=True),
+    }
+    if HAS_MODELS
+    else {}
+)
+
 # Create the server
 server = Server("fastapi-model-tester")
 
+# Resource and tool listings are fixed per process, so build them once
+_RESOURCE_LIST: list[types.Resource] = [
+    types.Resource(
+        uri="fastapi://models/status",
+        name="FastAPI Models Status",
+        description="Current status of FastAPI model availability",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri="fastapi://models/child/schema",
+        name="Child Model Schema",
+        description="Child model schema and validation rules",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri="fastapi://models/user/schema",
+        name="User Model Schema",
+        description="User model schema and validation rules",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri="fastapi://models/expenditure/schema",
+        name="Expenditure Model Schema",
+        description="Expenditure model schema and validation rules",
+        mimeType="application/json",
+    ),
+    types.Resource(
+        uri="fastapi://testing/coverage",
+        name="Model Test Coverage",
+        description="Current model testing coverage analysis",
+        mimeType="application/json",
+    ),
+]
+
+if HAS_FASTAPI_TESTING and HAS_APP:
+    _RESOURCE_LIST.append(
+        types.Resource(
+            uri="fastapi://endpoints/test-results",
+            name="Endpoint Test Results",
+            description="Real-time FastAPI endpoint test results",
+            mimeType="application/json",
+        )
+    )
+
 
 @server.list_resources()
 async def handle_list_resources() -> list[types.Resource]:
     """List available testing resources"""
-    resources = [
-        types.Resource(
-            uri="fastapi://models/status",
-            name="FastAPI Models Status",
-            description="Current status of FastAPI model availability",
-            mimeType="application/json",
-        ),
-        types.Resource(
-            uri="fastapi://models/child/schema",
-            name="Child Model Schema",
-            description="Child model schema and validation rules",
-            mimeType="application/json",
-        ),
-        types.Resource(
-            uri="fastapi://models/user/schema",
-            name="User Model Schema",
-            description="User model schema and validation rules",
-            mimeType="application/json",
-        ),
-        types.Resource(
-            uri="fastapi://models/expenditure/schema",
-            name="Expenditure Model Schema",
-            description="Expenditure model schema and validation rules",
-            mimeType="application/json",
-        ),
-        types.Resource(
-            uri="fastapi://testing/coverage",
-            name="Model Test Coverage",
-            description="Current model testing coverage analysis",
-            mimeType="application/json",
-        ),
-    ]
-
-    if HAS_FASTAPI_TESTING and HAS_APP:
-        resources.append(
-            types.Resource(
-                uri="fastapi://endpoints/test-results",
-                name="Endpoint Test Results",
-                description="Real-time FastAPI endpoint test results",
-                mimeType="application/json",
-            )
-        )
+    return _RESOURCE_LIST
+
+
+async def _read_status() -> str:
+    return f'{{\n  "timestamp": "{_now_iso()}",{_STATUS_TAIL}'
+
+
+async def _read_coverage() -> str:
+    return _dumps(analyze_model_test_coverage(), pretty=True)
+
+
+async def _read_test_results() -> str:
+    return _dumps(await run_live_endpoint_tests(), pretty=True)
 
-    return resources
+
+# Builders for resources whose content changes between reads
+_RESOURCE_HANDLERS = {
+    "fastapi://models/status": _read_status,
+    "fastapi://testing/coverage": _read_coverage,
+}
+if HAS_FASTAPI_TESTING and HAS_APP:
+    _RESOURCE_HANDLERS["fastapi://endpoints/test-results"] = _read_test_results
+
+_RESOURCE_NOT_FOUND = _dumps(
+    {"error": "Resource not found or dependencies not available"}
+)
 
 
 @server.read_resource()
-async def handle_read_resource(uri: str) -> str:
+async def handle_read_resource(uri: AnyUrl) -> str:
     """Read testing resource content"""
-
-    if uri == "fastapi://models/status":
-        status = {
-            "models_available": HAS_MODELS,
-            "app_available": HAS_APP,
-            "fastapi_testing_available": HAS_FASTAPI_TESTING,
-            "mcp_available": HAS_MCP,
-            "import_error": IMPORT_ERROR if not HAS_MODELS else None,
-            "timestamp": datetime.now().isoformat(),
-            "python_version": sys.version,
-            "testing_capabilities": {
-                "model_validation": HAS_MODELS,
-                "schema_analysis": HAS_MODELS,
-                "endpoint_testing": HAS_FASTAPI_TESTING and HAS_APP,
-                "integration_testing": HAS_MODELS and HAS_FASTAPI_TESTING and HAS_APP,
-            },
-        }
-        return json.dumps(status, indent=2)
-
-    elif uri == "fastapi://models/child/schema" and HAS_MODELS:
-        child_schema = {
-            "model_name": "Child",
-            "fields": {
-                "id": {
-                    "type": "str",
-                    "required": True,
-                    "description": "Unique identifier",
-                },
-                "name": {
-                    "type": "str",
-                    "required": True,
-                    "description": "Child's name",
-                },
-                "age": {"type": "int", "required": True, "description": "Child's age"},
-                "weekly_allowance": {
-                    "type": "float",
-                    "required": True,
-                    "description": "Weekly allowance amount",
+    # The server hands over a pydantic AnyUrl, which never equals a str key
+    uri = str(uri)
+    cached = _STATIC_RESOURCES.get(uri)
+    if cached is not None:
+        return cached
+
+    builder = _RESOURCE_HANDLERS.get(uri)
+    return await builder() if builder else _RESOURCE_NOT_FOUND
+
+
+_TOOL_LIST: list[types.Tool] = [
+    types.Tool(
+        name="validate_model_data",
+        description="Validate data against FastAPI model schemas",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model_type": {
+                    "type": "string",
+                    "enum": ["Child", "User", "Expenditure"],
                 },
-                "total_earnings": {
-                    "type": "float",
-                    "computed": True,
-                    "description": "Total earnings calculated",
-                },
-                "expenditures": {
-                    "type": "List[Expenditure]",
-                    "required": False,
-                    "description": "Child's expenditures",
+                "data": {"type": "object", "description": "Data to validate"},
+                "strict": {
+                    "type": "boolean",
+                    "default": True,
+                    "description": "Strict validation mode",
                 },
             },
-            "methods": ["total_earnings", "add_expenditure"],
-            "validation_rules": {
-                "age": "Must be positive integer",
-                "weekly_allowance": "Must be positive float",
-                "name": "Must be non-empty string",
-            },
-            "relationships": ["expenditures"],
-            "test_data_examples": [
-                {"name": "Alice", "age": 8, "weekly_allowance": 5.0},
-                {"name": "Bob", "age": 12, "weekly_allowance": 10.0},
-                {"name": "Charlie", "age": 6, "weekly_allowance": 3.0},
-            ],
-        }
-        return json.dumps(child_schema, indent=2)
-
-    elif uri == "fastapi://models/user/schema" and HAS_MODELS:
-        user_schema = {
-            "model_name": "User",
-            "fields": {
-                "email": {
-                    "type": "str",
-                    "required": True,
-                    "description": "User email (primary key)",
+            "required": ["model_type", "data"],
+        },
+    ),
+    types.Tool(
+        name="generate_test_data",
+        description="Generate realistic test data for models",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "model_type": {
+                    "type": "string",
+                    "enum": ["Child", "User", "Expenditure"],
                 },
-                "name": {
-                    "type": "str",
-                    "required": True,
-                    "description": "User display name",
+                "count": {
+                    "type": "integer",
+                    "default": 5,
+                    "description": "Number of records to generate",
                 },
-                "google_id": {
-                    "type": "str",
-                    "required": True,
-                    "description": "Google OAuth ID",
-                },
-                "picture": {
-                    "type": "str",
-                    "required": False,
-                    "description": "Profile picture URL",
-                },
-                "is_active": {
-                    "type": "bool",
-                    "default": True,
-                    "description": "User active status",
-                },
-                "is_admin": {
-                    "type": "bool",
-                    "default": False,
-                    "description": "Admin privileges",
-                },
-                "created_at": {
-                    "type": "datetime",
-                    "auto": True,
-                    "description": "Creation timestamp",
+                "scenario": {
+                    "type": "string",
+                    "enum": ["valid", "edge_cases", "invalid"],
+                    "default": "valid",
                 },
             },
-            "validation_rules": {
-                "email": "Must be valid email format",
-                "google_id": "Must be non-empty string",
-                "name": "Must be non-empty string",
-            },
-            "authentication_context": True,
-            "test_data_examples": [
-                {
-                    "email": "alice@example.com",
-                    "name": "Alice Smith",
-                    "google_id": "google123",
+            "required": ["model_type"],
+        },
+    ),
+    types.Tool(
+        name="test_model_relationships",
+        description="Test relationships between models",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "primary_model": {"type": "string", "enum": ["Child", "User"]},
+                "relationship_type": {
+                    "type": "string",
+                    "enum": ["one_to_many", "foreign_key"],
                 },
-                {
-                    "email": "bob@admin.com",
-                    "name": "Bob Admin",
-                    "google_id": "google456",
-                    "is_admin": True,
-                },
-            ],
-        }
-        return json.dumps(user_schema, indent=2)
-
-    elif uri == "fastapi://testing/coverage":
-        coverage = analyze_model_test_coverage()
-        return json.dumps(coverage, indent=2)
-
-    elif uri == "fastapi://endpoints/test-results" and HAS_FASTAPI_TESTING and HAS_APP:
-        results = run_live_endpoint_tests()
-        return json.dumps(results, indent=2)
-
-    else:
-        return json.dumps({"error": "Resource not found or dependencies not available"})
-
+                "test_scenario": {"type": "string", "default": "basic"},
+            },
+            "required": ["primary_model", "relationship_type"],
+        },
+    ),
+]
 
-@server.list_tools()
-async def handle_list_tools() -> list[types.Tool]:
-    """List available testing tools"""
-    tools = [
+if HAS_FASTAPI_TESTING and HAS_APP:
+    _TOOL_LIST.append(
         types.Tool(
-            name="validate_model_data",
-            description="Validate data against FastAPI model schemas",
+            name="test_fastapi_endpoints",
+            description="Test FastAPI endpoints with model data",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "model_type": {
+                    "endpoint": {
                         "type": "string",
-                        "enum": ["Child", "User", "Expenditure"],
+                        "description": "Endpoint to test",
                     },
-                    "data": {"type": "object", "description": "Data to validate"},
-                    "strict": {
-                        "type": "boolean",
-                        "default": True,
-                        "description": "Strict validation mode",
-                    },
-                },
-                "required": ["model_type", "data"],
-            },
-        ),
-        types.Tool(
-            name="generate_test_data",
-            description="Generate realistic test data for models",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "model_type": {
+                    "method": {
                         "type": "string",
-                        "enum": ["Child", "User", "Expenditure"],
+                        "enum": ["GET", "POST", "PUT", "DELETE"],
+                        "default": "GET",
                     },
-                    "count": {
-                        "type": "integer",
-                        "default": 5,
-                        "description": "Number of records to generate",
+                    "test_data": {
+                        "type": "object",
+                        "description": "Test data to send",
                     },
-                    "scenario": {
-                        "type": "string",
-                        "enum": ["valid", "edge_cases", "invalid"],
-                        "default": "valid",
+                    "auth_required": {"type": "boolean", "default": False},
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": (
+                            "Max response body bytes to return (default 4096); "
+                            "the body is only included when limit or offset is set"
+                        ),
                     },
-                },
-                "required": ["model_type"],
-            },
-        ),
-        types.Tool(
-            name="test_model_relationships",
-            description="Test relationships between models",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "primary_model": {"type": "string", "enum": ["Child", "User"]},
-                    "relationship_type": {
-                        "type": "string",
-                        "enum": ["one_to_many", "foreign_key"],
+                    "offset": {
+                        "type": "integer",
+                        "minimum": 0,
+                        "description": "Response body byte offset to read from",
                     },
-                    "test_scenario": {"type": "string", "default": "basic"},
                 },
-                "required": ["primary_model", "relationship_type"],
+                "required": ["endpoint"],
             },
-        ),
-    ]
-
-    if HAS_FASTAPI_TESTING and HAS_APP:
-        tools.append(
-            types.Tool(
-                name="test_fastapi_endpoints",
-                description="Test FastAPI endpoints with model data",
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "endpoint": {
-                            "type": "string",
-                            "description": "Endpoint to test",
-                        },
-                        "method": {
-                            "type": "string",
-                            "enum": ["GET", "POST", "PUT", "DELETE"],
-                            "default": "GET",
-                        },
-                        "test_data": {
-                            "type": "object",
-                            "description": "Test data to send",
-                        },
-                        "auth_required": {"type": "boolean", "default": False},
-                    },
-                    "required": ["endpoint"],
-                },
-            )
         )
+    )
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[types.Tool]:
+    """List available testing tools"""
+    return _TOOL_LIST
 
-    return tools
+
+def _execute_tool(name: str, arguments: dict) -> str:
+    """Run a tool and return its serialized result"""
+    match name:
+        case "validate_model_data":
+            result = validate_model_data(
+                arguments["model_type"],
+                arguments["data"],
+                arguments.get("strict", True),
+            )
+        case "generate_test_data":
+            result = generate_test_data(
+                arguments["model_type"],
+                arguments.get("count", 5),
+                arguments.get("scenario", "valid"),
+            )
+        case "test_model_relationships":
+            result = test_model_relationships(
+                arguments["primary_model"],
+                arguments["relationship_type"],
+                arguments.get("test_scenario", "basic"),
+            )
+        case "test_fastapi_endpoints":
+            result = test_fastapi_endpoints(*_endpoint_args(arguments))
+        case _:
+            result = {"error": "Tool not available or dependencies missing"}
+
+    return _dumps(result)
+
+
+def _endpoint_args(arguments: dict) -> tuple:
+    """Positional arguments for test_fastapi_endpoints from a tool call"""
+    return (
+        arguments["endpoint"],
+        arguments.get("method", "GET"),
+        arguments.get("test_data"),
+        arguments.get("auth_required", False),
+        arguments.get("limit"),
+        arguments.get("offset"),
+    )
+
+
+async def _run_endpoint_call(arguments: dict) -> str:
+    """Async counterpart of _execute_tool for one test_fastapi_endpoints call"""
+    return _dumps(await _test_fastapi_endpoints_async(*_endpoint_args(arguments)))
+
+
+# Tool calls are coalesced through a queue drained by a background worker;
+# endpoint tests that land within the coalescing window run concurrently
+_BATCH_MAX = 32
+_COALESCE_DELAY = 0.0003  # seconds
+_CALL_QUEUE: asyncio.Queue | None = None
+
+
+async def _batch_worker(queue: asyncio.Queue) -> None:
+    """Drain queued tool calls in batches grouped by tool name"""
+    loop = asyncio.get_running_loop()
+    get, execute = queue.get, _execute_tool
+    while True:
+        batch = [await get()]
+        deadline = loop.time() + _COALESCE_DELAY
+        while len(batch) < _BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(get(), timeout))
+            except TimeoutError:
+                break
+
+        endpoint_calls = []
+        for name, arguments, future in batch:
+            if future.done():
+                continue
+            if name == "test_fastapi_endpoints" and _ASYNC_ENDPOINTS:
+                endpoint_calls.append((arguments, future))
+                continue
+            try:
+                future.set_result(execute(name, arguments))
+            except Exception as e:
+                future.set_exception(e)
+
+        if not endpoint_calls:
+            continue
+        results = await asyncio.gather(
+            *(_run_endpoint_call(arguments) for arguments, _ in endpoint_calls),
+            return_exceptions=True,
+        )
+        for (_, future), result in zip(endpoint_calls, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     """Handle tool execution"""
+    if _CALL_QUEUE is None:
+        text = _execute_tool(name, arguments)
+    else:
+        future = asyncio.get_running_loop().create_future()
+        _CALL_QUEUE.put_nowait((name, arguments, future))
+        text = await future
+    return [types.TextContent(type="text", text=text)]
 
-    if name == "validate_model_data":
-        result = validate_model_data(
-            arguments["model_type"], arguments["data"], arguments.get("strict", True)
-        )
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
-    elif name == "generate_test_data":
-        result = generate_test_data(
-            arguments["model_type"],
-            arguments.get("count", 5),
-            arguments.get("scenario", "valid"),
-        )
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+# Field names per dataclass, resolved once instead of on every conversion
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
 
-    elif name == "test_model_relationships":
-        result = test_model_relationships(
-            arguments["primary_model"],
-            arguments["relationship_type"],
-            arguments.get("test_scenario", "basic"),
-        )
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
-
-    elif name == "test_fastapi_endpoints" and HAS_FASTAPI_TESTING and HAS_APP:
-        result = test_fastapi_endpoints(
-            arguments["endpoint"],
-            arguments.get("method", "GET"),
-            arguments.get("test_data"),
-            arguments.get("auth_required", False),
-        )
-        return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
 
+def _model_to_dict(obj) -> dict:
+    """Shallow dict of a model's fields, expanding nested model lists
+
+    Values are not copied, so callers must not mutate the returned dict.
+    """
+    cls = type(obj)
+    if is_dataclass(cls):
+        names = _FIELD_NAMES.get(cls)
+        if names is None:
+            names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
     else:
-        return [
-            types.TextContent(
-                type="text",
-                text=json.dumps(
-                    {"error": "Tool not available or dependencies missing"}
-                ),
-            )
-        ]
+        # Plain objects can differ per instance, so read their attributes each time
+        names = tuple(vars(obj))
+
+    result = {}
+    for name in names:
+        value = getattr(obj, name)
+        if isinstance(value, list):
+            value = [
+                _model_to_dict(v) if is_dataclass(v) or hasattr(v, "__dict__") else v
+                for v in value
+            ]
+        result[name] = value
+    return result
 
 
-def validate_model_data(model_type: str, data: dict, strict: bool = True) -> dict:
-    """Validate data against model schema"""
-    if not HAS_MODELS:
-        return {"error": "Models not available", "import_error": IMPORT_ERROR}
+# User fields echoed back by validation, fetched with one C-level getter
+_USER_FIELDS = ("email", "name", "google_id", "is_active", "is_admin")
+_get_user_fields = attrgetter(*_USER_FIELDS)
+
 
+def _validate_unavailable(model_type: str, data: dict, strict: bool = True) -> dict:
+    return {"error": "Models not available", "import_error": IMPORT_ERROR}
+
+
+def _validate_model_data(model_type: str, data: dict, strict: bool = True) -> dict:
+    """Validate data against model schema"""
     try:
         if model_type == "Child":
             child = Child(**data)
             return {
                 "valid": True,
                 "model": model_type,
-                "data": asdict(child),
+                "data": _model_to_dict(child),
                 "validation_passed": True,
             }
         elif model_type == "User":
@@ -407,13 +616,7 @@ def validate_model_data(model_type: str, data: dict, strict: bool = True) -> dic
             return {
                 "valid": True,
                 "model": model_type,
-                "data": {
-                    "email": user.email,
-                    "name": user.name,
-                    "google_id": user.google_id,
-                    "is_active": user.is_active,
-                    "is_admin": user.is_admin,
-                },
+                "data": dict(zip(_USER_FIELDS, _get_user_fields(user), strict=True)),
                 "validation_passed": True,
             }
         else:
@@ -429,40 +632,65 @@ def validate_model_data(model_type: str, data: dict, strict: bool = True) -> dic
         }
 
 
+# Availability is fixed at import, so bind the real implementation or a stub
+validate_model_data = _validate_model_data if HAS_MODELS else _validate_unavailable
+
+
+# Test data pools built once at import; generate_test_data slices them.
+# Entries are shared between calls, so they must not be mutated
+MAX_GEN = 1024
+
+
+def _child_template(i: int) -> dict:
+    return {"name": f"Child_{i}", "age": 5 + i, "weekly_allowance": 2.0 + i}
+
+
+def _user_template(i: int) -> dict:
+    return {
+        "email": f"user{i}@example.com",
+        "name": f"User {i}",
+        "google_id": f"google{i}",
+    }
+
+
+_VALID_CHILDREN = [_child_template(i) for i in range(MAX_GEN)]
+_VALID_USERS = [_user_template(i) for i in range(MAX_GEN)]
+_EDGE_CASE_CHILDREN = [
+    {"name": "A", "age": 1, "weekly_allowance": 0.01},  # Minimum values
+    {
+        "name": "Very Long Child Name Here",
+        "age": 18,
+        "weekly_allowance": 100.0,
+    },  # Maximum values
+]
+_INVALID_CHILDREN = [
+    {"name": "", "age": -1, "weekly_allowance": -5.0},  # Invalid values
+    {"age": 10},  # Missing required fields
+]
+_INVALID_USERS = [{"email": "invalid-email", "name": "", "google_id": ""}]
+
+
+def _take(pool: list, template, count: int) -> list:
+    """First count entries of a pool, generating any beyond its size"""
+    if count <= MAX_GEN:
+        return pool[: max(count, 0)]
+    return pool + [template(i) for i in range(MAX_GEN, count)]
+
+
 def generate_test_data(model_type: str, count: int, scenario: str) -> dict:
     """Generate test data for models"""
     if model_type == "Child":
         if scenario == "valid":
-            data = [
-                {"name": f"Child_{i}", "age": 5 + i, "weekly_allowance": 2.0 + i}
-                for i in range(count)
-            ]
+            data = _take(_VALID_CHILDREN, _child_template, count)
         elif scenario == "edge_cases":
-            data = [
-                {"name": "A", "age": 1, "weekly_allowance": 0.01},  # Minimum values
-                {
-                    "name": "Very Long Child Name Here",
-                    "age": 18,
-                    "weekly_allowance": 100.0,
-                },  # Maximum values
-            ]
+            data = _EDGE_CASE_CHILDREN
         else:  # invalid
-            data = [
-                {"name": "", "age": -1, "weekly_allowance": -5.0},  # Invalid values
-                {"age": 10},  # Missing required fields
-            ]
+            data = _INVALID_CHILDREN
     elif model_type == "User":
         if scenario == "valid":
-            data = [
-                {
-                    "email": f"user{i}@example.com",
-                    "name": f"User {i}",
-                    "google_id": f"google{i}",
-                }
-                for i in range(count)
-            ]
+            data = _take(_VALID_USERS, _user_template, count)
         else:
-            data = [{"email": "invalid-email", "name": "", "google_id": ""}]
+            data = _INVALID_USERS
     else:
         data = []
 
@@ -474,6 +702,11 @@ def generate_test_data(model_type: str, count: int, scenario: str) -> dict:
     }
 
 
+def _make_expenditure(amount: float, description: str):
+    """Fresh fixture Expenditure for a relationship test"""
+    return Expenditure(amount=amount, description=description, date=datetime.now())
+
+
 def test_model_relationships(
     primary_model: str, relationship_type: str, scenario: str
 ) -> dict:
@@ -485,9 +718,7 @@ def test_model_relationships(
         if primary_model == "Child" and relationship_type == "one_to_many":
             # Test Child -> Expenditures relationship
             child = Child(name="Test Child", age=10, weekly_allowance=5.0)
-            expenditure = Expenditure(
-                amount=2.50, description="Candy", date=datetime.now()
-            )
+            expenditure = _make_expenditure(2.50, "Candy")
 
             child.add_expenditure(expenditure)
 
@@ -507,58 +738,174 @@ def test_model_relationships(
         return {"error": str(e), "relationship_test_failed": True}
 
 
-def test_fastapi_endpoints(
-    endpoint: str, method: str, test_data: dict = None, auth_required: bool = False
+# Response bodies are returned a page at a time to keep tool output small
+_BODY_PAGE_SIZE = 4096
+
+
+def _resp_size(response) -> int:
+    """Body size from Content-Length, reading the body only when it's absent"""
+    content_length = response.headers.get("content-length")
+    return int(content_length) if content_length else len(response.content)
+
+
+def _check_page(limit: int, offset: int) -> None:
+    if limit <= 0:
+        raise ValueError(f"limit must be positive, got {limit}")
+    if offset < 0:
+        raise ValueError(f"offset must not be negative, got {offset}")
+
+
+def _page_bounds(limit: int | None, offset: int | None) -> tuple[int, int] | None:
+    """Requested body page, or None when neither limit nor offset was given"""
+    if limit is None and offset is None:
+        return None
+    page = (_BODY_PAGE_SIZE if limit is None else limit, offset or 0)
+    _check_page(*page)
+    return page
+
+
+def _body_page(content: bytes, limit: int, offset: int) -> str:
+    """Decode one page of a response body, noting where the next page starts"""
+    _check_page(limit, offset)
+    end = offset + limit
+    page = content[offset:end].decode(errors="replace")
+    if end < len(content):
+        page += f"[truncated; use offset={end} to read more]"
+    return page
+
+
+# Signed test-user token, reused until the TTL lapses (tokens live 24h)
+_AUTH_TOKEN_TTL = 300.0  # seconds
+_AUTH_TOKEN_CACHE = {"exp": 0.0, "token": None, "headers": None}
+
+
+def _auth_headers() -> dict:
+    """Authorization headers for the fixed test user"""
+    if time.monotonic() < _AUTH_TOKEN_CACHE["exp"]:
+        return _AUTH_TOKEN_CACHE["headers"]
+
+    from handlers.auth import User, create_access_token, users_db
+
+    users_db.setdefault(
+        "test@example.com",
+        User(email="test@example.com", name="Test User", google_id="test123"),
+    )
+    token = create_access_token({"sub": "test@example.com", "google_id": "test123"})
+    _AUTH_TOKEN_CACHE["token"] = token
+    _AUTH_TOKEN_CACHE["headers"] = {"Authorization": f"Bearer {token}"}
+    _AUTH_TOKEN_CACHE["exp"] = time.monotonic() + _AUTH_TOKEN_TTL
+    return _AUTH_TOKEN_CACHE["headers"]
+
+
+def _endpoints_unavailable(
+    endpoint: str,
+    method: str,
+    test_data: dict = None,
+    auth_required: bool = False,
+    limit: int | None = None,
+    offset: int | None = None,
 ) -> dict:
-    """Test FastAPI endpoints"""
-    if not HAS_FASTAPI_TESTING or not HAS_APP:
-        return {"error": "FastAPI testing dependencies or app not available"}
+    return {"error": "FastAPI testing dependencies or app not available"}
+
+
+_ENDPOINT_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
 
+
+def _endpoint_result(
+    endpoint: str,
+    method: str,
+    response,
+    headers: dict | None,
+    test_data: dict | None,
+    page: tuple[int, int] | None,
+) -> dict:
+    """Tool result for one endpoint response"""
+    result = {
+        "endpoint": endpoint,
+        "method": method,
+        "status_code": response.status_code,
+        "success": response.status_code < 400,
+        "response_size": _resp_size(response),
+        "headers_sent": headers,
+        "test_data_sent": test_data,
+    }
+    if page is not None:
+        result["response_body"] = _body_page(response.content, *page)
+    return result
+
+
+def _test_fastapi_endpoints(
+    endpoint: str,
+    method: str,
+    test_data: dict = None,
+    auth_required: bool = False,
+    limit: int | None = None,
+    offset: int | None = None,
+) -> dict:
+    """Test FastAPI endpoints"""
+    if method not in _ENDPOINT_METHODS:
+        return {"error": f"Unsupported method: {method}"}
     try:
-        client = TestClient(app)
+        page = _page_bounds(limit, offset)
+    except ValueError as e:
+        return {"error": str(e)}
 
-        headers = {}
+    try:
+        headers = None
         if auth_required and HAS_MODELS:
-            # Create a test token
-            from handlers.auth import User, create_access_token, users_db
+            headers = _auth_headers()
 
-            user = User(email="test@example.com", name="Test User", google_id="test123")
-            users_db["test@example.com"] = user
-            token = create_access_token(
-                {"sub": "test@example.com", "google_id": "test123"}
-            )
-            headers["Authorization"] = f"Bearer {token}"
-
-        # Make the request
-        if method == "GET":
-            response = client.get(endpoint, headers=headers)
-        elif method == "POST":
-            response = client.post(endpoint, json=test_data, headers=headers)
-        elif method == "PUT":
-            response = client.put(endpoint, json=test_data, headers=headers)
-        elif method == "DELETE":
-            response = client.delete(endpoint, headers=headers)
-        else:
-            return {"error": f"Unsupported method: {method}"}
+        json_body = test_data if method in ("POST", "PUT") else None
+        response = _get_client().request(
+            method, endpoint, json=json_body, headers=headers
+        )
+        return _endpoint_result(endpoint, method, response, headers, test_data, page)
+
+    except Exception as e:
+        return {"error": f"Failed to test endpoint: {str(e)}"}
 
-        return {
-            "endpoint": endpoint,
-            "method": method,
-            "status_code": response.status_code,
-            "success": response.status_code < 400,
-            "response_size": len(response.content),
-            "headers_sent": dict(headers),
-            "test_data_sent": test_data,
-        }
+
+async def _test_fastapi_endpoints_async(
+    endpoint: str,
+    method: str,
+    test_data: dict = None,
+    auth_required: bool = False,
+    limit: int | None = None,
+    offset: int | None = None,
+) -> dict:
+    """Test FastAPI endpoints over the shared AsyncClient"""
+    if method not in _ENDPOINT_METHODS:
+        return {"error": f"Unsupported method: {method}"}
+    try:
+        page = _page_bounds(limit, offset)
+    except ValueError as e:
+        return {"error": str(e)}
+
+    try:
+        headers = None
+        if auth_required and HAS_MODELS:
+            headers = _auth_headers()
+
+        json_body = test_data if method in ("POST", "PUT") else None
+        response = await _get_async_client().request(
+            method, endpoint, json=json_body, headers=headers
+        )
+        return _endpoint_result(endpoint, method, response, headers, test_data, page)
 
     except Exception as e:
         return {"error": f"Failed to test endpoint: {str(e)}"}
 
 
+_ASYNC_ENDPOINTS = HAS_FASTAPI_TESTING and HAS_APP
+test_fastapi_endpoints = (
+    _test_fastapi_endpoints if _ASYNC_ENDPOINTS else _endpoints_unavailable
+)
+
+
 def analyze_model_test_coverage() -> dict:
     """Analyze current model test coverage"""
     coverage = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "models_analyzed": [],
         "coverage_summary": {},
         "recommendations": [],
@@ -595,53 +942,56 @@ def analyze_model_test_coverage() -> dict:
     return coverage
 
 
-def run_live_endpoint_tests() -> dict:
+async def run_live_endpoint_tests() -> dict:
     """Run live tests against FastAPI endpoints"""
     if not HAS_FASTAPI_TESTING or not HAS_APP:
         return {"error": "FastAPI testing dependencies or app not available"}
 
     try:
-        client = TestClient(app)
-
+        get = _get_async_client().get
+        endpoint_tests = []
+        summary = {"passed": 0, "failed": 0}
         results = {
-            "timestamp": datetime.now().isoformat(),
-            "endpoint_tests": [],
-            "summary": {"passed": 0, "failed": 0},
+            "timestamp": _now_iso(),
+            "endpoint_tests": endpoint_tests,
+            "summary": summary,
         }
+        append = endpoint_tests.append
 
-        # Test public endpoints
+        # Test public endpoints concurrently
         endpoints_to_test = [("/", "GET"), ("/health", "GET"), ("/debug", "GET")]
+        responses = await asyncio.gather(
+            *(get(endpoint) for endpoint, _ in endpoints_to_test),
+            return_exceptions=True,
+        )
 
-        for endpoint, method in endpoints_to_test:
-            try:
-                if method == "GET":
-                    response = client.get(endpoint)
-
-                test_result = {
-                    "endpoint": endpoint,
-                    "method": method,
-                    "status_code": response.status_code,
-                    "success": response.status_code < 400,
-                    "response_size": len(response.content),
-                }
-
-                if test_result["success"]:
-                    results["summary"]["passed"] += 1
-                else:
-                    results["summary"]["failed"] += 1
-
-                results["endpoint_tests"].append(test_result)
-
-            except Exception as e:
-                results["endpoint_tests"].append(
+        for (endpoint, method), response in zip(
+            endpoints_to_test, responses, strict=True
+        ):
+            if isinstance(response, Exception):
+                append(
                     {
                         "endpoint": endpoint,
                         "method": method,
-                        "error": str(e),
+                        "error": str(response),
                         "success": False,
                     }
                 )
-                results["summary"]["failed"] += 1
+                summary["failed"] += 1
+                continue
+
+            status_code = response.status_code
+            success = status_code < 400
+            append(
+                {
+                    "endpoint": endpoint,
+                    "method": method,
+                    "status_code": status_code,
+                    "success": success,
+                    "response_size": _resp_size(response),
+                }
+            )
+            summary["passed" if success else "failed"] += 1
 
         return results
 
@@ -649,18 +999,82 @@ def run_live_endpoint_tests() -> dict:
         return {"error": f"Failed to run endpoint tests: {str(e)}"}
 
 
+class _BatchedStdout:
+    """Coalesce MCP frames written while a previous write is in flight
+
+    Stands in for the anyio-wrapped stdout that stdio_server writes and
+    flushes once per JSON-RPC frame. A flush with nothing in flight starts
+    writing at once on a worker thread; frames that arrive meanwhile go out
+    together in the next write.
+    """
+
+    def __init__(self, raw, max_buffer: int = 64 * 1024):
+        self._raw = raw
+        self._max_buffer = max_buffer
+        self._buf = bytearray()
+        self._writer: asyncio.Task | None = None
+
+    async def write(self, data: str) -> None:
+        self._buf += data.encode()
+        if len(self._buf) >= self._max_buffer:
+            await self.drain()
+
+    async def flush(self) -> None:
+        if self._buf and self._writer is None:
+            self._writer = asyncio.create_task(self._write_buffered())
+
+    async def drain(self) -> None:
+        """Wait until everything buffered so far has been written"""
+        await self.flush()
+        if self._writer is not None:
+            await asyncio.shield(self._writer)
+
+    async def _write_buffered(self) -> None:
+        try:
+            while self._buf:
+                data = bytes(self._buf)
+                self._buf.clear()
+                await anyio.to_thread.run_sync(self._write_raw, data)
+        finally:
+            self._writer = None
+
+    def _write_raw(self, data: bytes) -> None:
+        self._raw.write(data)
+        self._raw.flush()
+
+
 async def main():
     """Main function to run the MCP server"""
     if not HAS_MCP:
         print("MCP not available. Install with: uv add mcp")
         return
 
+    global _CALL_QUEUE
+    _CALL_QUEUE = asyncio.Queue()
+    worker = asyncio.create_task(_batch_worker(_CALL_QUEUE))
+
+    stdout = _BatchedStdout(sys.stdout.buffer)
+
     # Run the server using stdio
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream, write_stream, server.create_initialization_options()
-        )
+    try:
+        async with stdio_server(stdout=stdout) as (read_stream, write_stream):
+            await server.run(
+                read_stream, write_stream, server.create_initialization_options()
+            )
+    finally:
+        worker.cancel()
+        _CALL_QUEUE = None
+        await stdout.drain()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop ships with uvicorn[standard]; use the stock loop where it's missing
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    with asyncio.Runner(
+        loop_factory=uvloop.new_event_loop if uvloop else None
+    ) as runner:
+        runner.run(main())
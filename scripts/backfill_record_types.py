@@ -0,0 +1,31 @@
+"""Tag expenditures written before record_type existed
+
+Listing every child's expenditures queries the record_type GSI, which only
+sees items that carry record_type. Run this once per table after deploying,
+before relying on that listing, e.g.
+
+    DYNAMODB_TABLE=allowance-data-production uv run python scripts/backfill_record_types.py
+
+Safe to run while the app is taking writes, and to rerun.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.database import get_db_service  # noqa: E402
+
+
+def main():
+    db_service = get_db_service()
+    if db_service.mock_mode:
+        print("DynamoDB is not available; nothing to backfill")
+        return 1
+
+    print(f"Tagged {db_service.backfill_record_types()} expenditures")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Seed each child's running TOTAL item from its expenditure history
+
+Until a child's TOTAL has been seeded, get_total_spent sums the child's full
+history on every read. Run this once per table after deploying, e.g.
+
+    DYNAMODB_TABLE=allowance-data-production uv run python scripts/backfill_totals.py
+
+Without arguments every child with an expenditure is found by scanning the
+table, so legacy items lacking record_type are covered too. Pass child names
+to seed only those children (children with no expenditures yet are only
+seeded when named). Safe to run while the app is taking writes.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.database import get_db_service  # noqa: E402
+
+
+def main(argv):
+    db_service = get_db_service()
+    if db_service.mock_mode:
+        print("DynamoDB is not available; nothing to backfill")
+        return 1
+
+    for child_name, total in db_service.backfill_totals(argv or None).items():
+        print(f"{child_name}: ${total:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -5,13 +5,15 @@ set -e
 STACK_NAME="child-allowance-tracker"
 REGION="us-east-1"
 ENVIRONMENT="production"
+# Comma-separated browser origins allowed to call the API (none by default)
+CORS_ORIGINS="${CORS_ORIGINS:-}"
 
 echo "Deploying infrastructure..."
 
 aws cloudformation deploy \
   --template-file infrastructure/cloudformation.yaml \
   --stack-name $STACK_NAME \
-  --parameter-overrides Environment=$ENVIRONMENT \
+  --parameter-overrides Environment=$ENVIRONMENT "CorsOrigins=$CORS_ORIGINS" \
   --capabilities CAPABILITY_IAM \
   --region $REGION
 
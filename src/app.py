@@ -1,18 +1,60 @@
 """FastAPI application for Child Allowance Tracker"""
 
+import hashlib
 import logging
 import os
+import sys
+import time
 from datetime import datetime
+from decimal import Decimal
+from itertools import count
 
-from fastapi import FastAPI, HTTPException
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from pydantic import BaseModel
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi.routing import APIRoute
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import BaseModel, TypeAdapter
+from starlette.exceptions import HTTPException as StarletteHTTPException
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The working directory and environment are fixed for the life of the process
+_CWD = os.getcwd()
+_ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+_DEBUG_ENV = {
+    "ENVIRONMENT": os.getenv("ENVIRONMENT", "not_set"),
+    "AWS_REGION": os.getenv("AWS_REGION", "not_set"),
+    "AWS_LAMBDA_FUNCTION_NAME": os.getenv("AWS_LAMBDA_FUNCTION_NAME", "not_set"),
+}
+
+# Browsers reject a wildcard origin on credentialed requests, so CORS is
+# limited to an explicit, comma-separated CORS_ORIGINS list
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000").split(",")
+    if origin.strip()
+]
+
+# Second-granularity timestamp for status endpoints, reformatted at most once
+# a second however often load balancers poll
+_ts_cache = {"t": 0.0, "s": ""}
+
+
+def _now_iso() -> str:
+    """Current local time in ISO format, cached for up to a second"""
+    now = time.time()
+    if now - _ts_cache["t"] > 1.0:
+        _ts_cache["t"] = now
+        _ts_cache["s"] = datetime.fromtimestamp(now).isoformat()
+    return _ts_cache["s"]
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Child Allowance Tracker",
@@ -20,18 +62,62 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
-# Add CORS middleware
+
+# Add CORS middleware before anything else touches the app
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
 
+class _ORJSONRequest(Request):
+    """Request that parses its JSON body with orjson"""
+
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class _ORJSONRoute(APIRoute):
+    """Route that hands endpoints an orjson-parsing request"""
+
+    def get_route_handler(self):
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            return await handler(_ORJSONRequest(request.scope, request.receive))
+
+        return route_handler
+
+
+# Bodies are still validated by pydantic; only the JSON decode is swapped
+app.router.route_class = _ORJSONRoute
+
+
+# Error bodies go through orjson like every other response
+@app.exception_handler(StarletteHTTPException)
+async def http_exception_handler(request: Request, exc: StarletteHTTPException):
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse(
+        {"detail": exc.detail}, status_code=exc.status_code, headers=headers
+    )
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    # Error ctx can hold exception objects, which only jsonable_encoder handles
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, status_code=422)
+
+
 # Pydantic models
 class Child(BaseModel):
     id: str | None = None
@@ -61,10 +147,49 @@ class Chore(BaseModel):
     completed_date: datetime | None = None
 
 
+# Model responses are serialized by pydantic-core straight to JSON. Returning a
+# Response skips FastAPI's response_model validate + encode pass; the
+# response_model declarations still describe the payloads in OpenAPI.
+_CHILDREN_JSON = TypeAdapter(list[Child])
+_TRANSACTIONS_JSON = TypeAdapter(list[Transaction])
+_CHORES_JSON = TypeAdapter(list[Chore])
+
+
+def _json_response(content: bytes | str) -> Response:
+    """Wrap already-serialized JSON in a response"""
+    return Response(content=content, media_type="application/json")
+
+
 # In-memory storage (replace with database in production)
-children_db: list[Child] = []
+# Children and chores are keyed by id; dicts keep insertion order for listings
+children_db: dict[str, Child] = {}
 transactions_db: list[Transaction] = []
-chores_db: list[Chore] = []
+transactions_by_child: dict[str, list[Transaction]] = {}
+chores_db: dict[str, Chore] = {}
+# Secondary chore indexes (id -> chore) for the /chores filters
+chores_by_assignee: dict[str, dict[str, Chore]] = {}
+chores_by_status: dict[bool, dict[str, Chore]] = {False: {}, True: {}}
+
+# Id counters never go backwards, so ids aren't reused after a delete
+_child_ids = count(1)
+_transaction_ids = count(1)
+_chore_ids = count(1)
+
+# Transaction totals maintained on every write so the summary never rescans
+# transactions. Money is summed as Decimal so the totals stay exact; the
+# balance total is recomputed from children_db since balances can be edited
+# and deleted, which a running float sum would drift across
+_aggregates = {
+    "total_allowances": Decimal(0),
+    "total_chore_earnings": Decimal(0),
+    "total_spending": Decimal(0),
+    "completed_chores": 0,
+}
+_AGGREGATE_BY_TYPE = {
+    "allowance": "total_allowances",
+    "chore": "total_chore_earnings",
+    "spending": "total_spending",
+}
 
 
 # Health check endpoint
@@ -73,44 +198,42 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "service": "child-allowance-tracker",
         "version": "1.0.0",
-        "environment": os.getenv("ENVIRONMENT", "development"),
+        "environment": _ENVIRONMENT,
     }
 
 
-# Root endpoint
-@app.get("/")
-async def root():
-    """Root endpoint with API information"""
-    return {
+# Root endpoint; the payload never changes, so it is encoded once at import
+_ROOT_JSON = orjson.dumps(
+    {
         "message": "Child Allowance Tracker API",
         "status": "running",
         "version": "1.0.0",
         "documentation": "/docs",
         "health": "/health",
     }
+)
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+
+@app.get("/")
+async def root():
+    """Root endpoint with API information"""
+    return Response(_ROOT_JSON, media_type="application/json", headers=_ROOT_HEADERS)
 
 
 # Debug endpoint
 @app.get("/debug")
 async def debug_info():
     """Debug information endpoint"""
-    import sys
-
     return {
         "python_version": sys.version,
-        "current_directory": os.getcwd(),
-        "environment_variables": {
-            "ENVIRONMENT": os.getenv("ENVIRONMENT", "not_set"),
-            "AWS_REGION": os.getenv("AWS_REGION", "not_set"),
-            "AWS_LAMBDA_FUNCTION_NAME": os.getenv(
-                "AWS_LAMBDA_FUNCTION_NAME", "not_set"
-            ),
-        },
+        "current_directory": _CWD,
+        "environment_variables": _DEBUG_ENV,
         "fastapi_working": True,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now_iso(),
         "data_counts": {
             "children": len(children_db),
             "transactions": len(transactions_db),
@@ -123,54 +246,53 @@ async def debug_info():
 @app.get("/children", response_model=list[Child])
 async def get_children():
     """Get all children"""
-    return children_db
+    return _json_response(_CHILDREN_JSON.dump_json(list(children_db.values())))
 
 
 @app.post("/children", response_model=Child)
 async def create_child(child: Child):
     """Create a new child"""
     # Generate ID and set creation time
-    child.id = f"child_{len(children_db) + 1}"
+    child.id = f"child_{next(_child_ids)}"
     child.created_at = datetime.now()
 
-    children_db.append(child)
+    children_db[child.id] = child
     logger.info(f"Created child: {child.name}")
-    return child
+    return _json_response(child.model_dump_json())
 
 
 @app.get("/children/{child_id}", response_model=Child)
 async def get_child(child_id: str):
     """Get a specific child by ID"""
-    child = next((c for c in children_db if c.id == child_id), None)
+    child = children_db.get(child_id)
     if not child:
         raise HTTPException(status_code=404, detail="Child not found")
-    return child
+    return _json_response(child.model_dump_json())
 
 
 @app.put("/children/{child_id}", response_model=Child)
 async def update_child(child_id: str, child_update: Child):
     """Update a child's information"""
-    child_index = next((i for i, c in enumerate(children_db) if c.id == child_id), None)
-    if child_index is None:
+    existing = children_db.get(child_id)
+    if existing is None:
         raise HTTPException(status_code=404, detail="Child not found")
 
     # Preserve ID and creation time
     child_update.id = child_id
-    child_update.created_at = children_db[child_index].created_at
-    children_db[child_index] = child_update
+    child_update.created_at = existing.created_at
+    children_db[child_id] = child_update
 
     logger.info(f"Updated child: {child_id}")
-    return child_update
+    return _json_response(child_update.model_dump_json())
 
 
 @app.delete("/children/{child_id}")
 async def delete_child(child_id: str):
     """Delete a child"""
-    child_index = next((i for i, c in enumerate(children_db) if c.id == child_id), None)
-    if child_index is None:
+    deleted_child = children_db.pop(child_id, None)
+    if deleted_child is None:
         raise HTTPException(status_code=404, detail="Child not found")
 
-    deleted_child = children_db.pop(child_index)
     logger.info(f"Deleted child: {child_id}")
     return {"message": f"Child {deleted_child.name} deleted successfully"}
 
@@ -180,82 +302,97 @@ async def delete_child(child_id: str):
 async def get_transactions(child_id: str | None = None):
     """Get all transactions, optionally filtered by child_id"""
     if child_id:
-        return [t for t in transactions_db if t.child_id == child_id]
-    return transactions_db
+        return _json_response(
+            _TRANSACTIONS_JSON.dump_json(transactions_by_child.get(child_id, []))
+        )
+    return _json_response(_TRANSACTIONS_JSON.dump_json(transactions_db))
 
 
 @app.post("/transactions", response_model=Transaction)
 async def create_transaction(transaction: Transaction):
     """Create a new transaction"""
     # Verify child exists
-    child = next((c for c in children_db if c.id == transaction.child_id), None)
+    child = children_db.get(transaction.child_id)
     if not child:
         raise HTTPException(status_code=404, detail="Child not found")
 
     # Generate ID and set date
-    transaction.id = f"trans_{len(transactions_db) + 1}"
+    transaction.id = f"trans_{next(_transaction_ids)}"
     transaction.date = datetime.now()
 
     # Update child's balance
-    child_index = next(
-        i for i, c in enumerate(children_db) if c.id == transaction.child_id
-    )
     if transaction.transaction_type in ["allowance", "chore"]:
-        children_db[child_index].current_balance += transaction.amount
+        child.current_balance += transaction.amount
     elif transaction.transaction_type == "spending":
-        children_db[child_index].current_balance -= transaction.amount
+        child.current_balance -= transaction.amount
     elif transaction.transaction_type == "adjustment":
-        children_db[child_index].current_balance += transaction.amount
+        child.current_balance += transaction.amount
+
+    aggregate = _AGGREGATE_BY_TYPE.get(transaction.transaction_type)
+    if aggregate:
+        _aggregates[aggregate] += Decimal(str(transaction.amount))
 
     transactions_db.append(transaction)
+    transactions_by_child.setdefault(transaction.child_id, []).append(transaction)
     logger.info(
         f"Created transaction: {transaction.transaction_type} for {transaction.child_id}"
     )
-    return transaction
+    return _json_response(transaction.model_dump_json())
 
 
 # Chore endpoints
 @app.get("/chores", response_model=list[Chore])
 async def get_chores(assigned_to: str | None = None, completed: bool | None = None):
     """Get all chores, optionally filtered by assignment and completion status"""
-    filtered_chores = chores_db
-
     if assigned_to:
-        filtered_chores = [c for c in filtered_chores if c.assigned_to == assigned_to]
-
-    if completed is not None:
-        filtered_chores = [c for c in filtered_chores if c.completed == completed]
+        assigned = chores_by_assignee.get(assigned_to, {})
+        if completed is None:
+            filtered_chores = list(assigned.values())
+        else:
+            with_status = chores_by_status[completed]
+            filtered_chores = [c for i, c in assigned.items() if i in with_status]
+    elif completed is not None:
+        filtered_chores = list(chores_by_status[completed].values())
+    else:
+        filtered_chores = list(chores_db.values())
 
-    return filtered_chores
+    return _json_response(_CHORES_JSON.dump_json(filtered_chores))
 
 
 @app.post("/chores", response_model=Chore)
 async def create_chore(chore: Chore):
     """Create a new chore"""
-    chore.id = f"chore_{len(chores_db) + 1}"
-    chores_db.append(chore)
+    chore.id = f"chore_{next(_chore_ids)}"
+    chores_db[chore.id] = chore
+    chores_by_status[chore.completed][chore.id] = chore
+    if chore.assigned_to:
+        chores_by_assignee.setdefault(chore.assigned_to, {})[chore.id] = chore
+    if chore.completed:
+        _aggregates["completed_chores"] += 1
     logger.info(f"Created chore: {chore.name}")
-    return chore
+    return _json_response(chore.model_dump_json())
 
 
 @app.put("/chores/{chore_id}/complete")
 async def complete_chore(chore_id: str):
     """Mark a chore as completed and create transaction"""
-    chore_index = next((i for i, c in enumerate(chores_db) if c.id == chore_id), None)
-    if chore_index is None:
+    chore = chores_db.get(chore_id)
+    if chore is None:
         raise HTTPException(status_code=404, detail="Chore not found")
 
-    chore = chores_db[chore_index]
     if chore.completed:
         raise HTTPException(status_code=400, detail="Chore already completed")
 
     # Mark chore as completed
-    chores_db[chore_index].completed = True
-    chores_db[chore_index].completed_date = datetime.now()
+    chore.completed = True
+    chore.completed_date = datetime.now()
+    chores_by_status[True][chore_id] = chores_by_status[False].pop(chore_id)
+    _aggregates["completed_chores"] += 1
 
     # Create transaction if chore is assigned
     if chore.assigned_to:
-        transaction = Transaction(
+        # Built from an already-validated chore, so skip re-validation
+        transaction = Transaction.model_construct(
             child_id=chore.assigned_to,
             amount=chore.value,
             description=f"Completed chore: {chore.name}",
@@ -271,26 +408,16 @@ async def complete_chore(chore_id: str):
 @app.get("/reports/summary")
 async def get_summary():
     """Get summary report of all data"""
-    total_allowances = sum(
-        t.amount for t in transactions_db if t.transaction_type == "allowance"
-    )
-    total_chore_earnings = sum(
-        t.amount for t in transactions_db if t.transaction_type == "chore"
-    )
-    total_spending = sum(
-        t.amount for t in transactions_db if t.transaction_type == "spending"
-    )
-
     return {
         "summary": {
             "total_children": len(children_db),
             "total_transactions": len(transactions_db),
             "total_chores": len(chores_db),
-            "completed_chores": len([c for c in chores_db if c.completed]),
-            "total_allowances_paid": total_allowances,
-            "total_chore_earnings": total_chore_earnings,
-            "total_spending": total_spending,
-            "total_balances": sum(c.current_balance for c in children_db),
+            "completed_chores": _aggregates["completed_chores"],
+            "total_allowances_paid": float(_aggregates["total_allowances"]),
+            "total_chore_earnings": float(_aggregates["total_chore_earnings"]),
+            "total_spending": float(_aggregates["total_spending"]),
+            "total_balances": sum(c.current_balance for c in children_db.values()),
         },
         "children": [
             {
@@ -299,19 +426,15 @@ async def get_summary():
                 "balance": child.current_balance,
                 "weekly_allowance": child.weekly_allowance,
             }
-            for child in children_db
+            for child in children_db.values()
         ],
-        "recent_transactions": sorted(
-            transactions_db, key=lambda t: t.date or datetime.min, reverse=True
-        )[:10],
+        # create_transaction stamps the date on append, so the list is chronological
+        "recent_transactions": transactions_db[-10:][::-1],
     }
 
 
-# Simple HTML interface (for basic testing)
-@app.get("/ui", response_class=HTMLResponse)
-async def get_ui():
-    """Simple HTML interface for testing"""
-    html_content = """
+# Simple HTML interface (for basic testing), encoded once at import
+_UI_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
@@ -343,11 +466,31 @@ async def get_ui():
     </body>
     </html>
     """
-    return HTMLResponse(content=html_content)
+_UI_HTML_BYTES = _UI_HTML.encode("utf-8")
+_UI_ETAG = f'"{hashlib.sha256(_UI_HTML_BYTES).hexdigest()}"'
+_UI_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": _UI_ETAG}
+
+
+@app.get("/ui", response_class=HTMLResponse)
+async def get_ui(request: Request):
+    """Simple HTML interface for testing"""
+    if request.headers.get("if-none-match") == _UI_ETAG:
+        return Response(status_code=304, headers=_UI_HEADERS)
+    return HTMLResponse(content=_UI_HTML_BYTES, headers=_UI_HEADERS)
 
 
 if __name__ == "__main__":
     # For local development
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools come with uvicorn[standard]. Workers need the
+    # import string; the stores above are per-process, so scale out only
+    # via WEB_CONCURRENCY once state lives in DynamoDB
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
@@ -1,13 +1,18 @@
 """Authentication module with Google OAuth integration"""
 
+import hashlib
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 
+import jwt
 from authlib.integrations.starlette_client import OAuth
 from fastapi import Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+from jwt.exceptions import PyJWTError as JWTError
 from pydantic import BaseModel
 
 from utils.logger import get_logger
@@ -90,8 +95,23 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 
+# Recently verified tokens, keyed by a blake2b digest of the token so the
+# cache never holds bearer credentials. Entries live at most
+# _TOKEN_CACHE_TTL seconds and never outlive the token's own expiry; the dict
+# is kept in least-recently-used order so a full cache evicts the coldest one.
+_TOKEN_CACHE_TTL = 60.0
+_TOKEN_CACHE_MAX = 2048
+_token_cache: dict[bytes, tuple[float, TokenData]] = {}
+
+
 def verify_token(token: str) -> TokenData | None:
     """Verify JWT token and return token data"""
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.pop(key, None)
+    if cached is not None and cached[0] > time.time():
+        _token_cache[key] = cached
+        return cached[1]
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
@@ -104,6 +124,12 @@ def verify_token(token: str) -> TokenData | None:
             )
 
         token_data = TokenData(email=email, google_id=google_id)
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            del _token_cache[next(iter(_token_cache))]
+        expires_at = time.time() + _TOKEN_CACHE_TTL
+        if "exp" in payload:
+            expires_at = min(expires_at, payload["exp"])
+        _token_cache[key] = (expires_at, token_data)
         return token_data
 
     except JWTError as e:
@@ -111,10 +137,82 @@ def verify_token(token: str) -> TokenData | None:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
 
+# User persistence. When a DynamoDB table is configured (as in the deployed
+# Lambda) users are stored there so they survive cold starts and are shared
+# across instances; users_db remains the in-process read-through cache.
+def _user_table():
+    """Return the DynamoDB table for user records, or None if not configured
+
+    Resolved on every call, like services.database.get_table(), so a change
+    to DYNAMODB_TABLE is not masked by a stale answer.
+    """
+    if not os.getenv("DYNAMODB_TABLE"):
+        return None
+    from services.database import get_table
+
+    return get_table()
+
+
+def _user_key(email: str) -> dict:
+    return {"pk": f"USER#{email}", "sk": "PROFILE"}
+
+
+def _save_user(user: User) -> None:
+    """Cache the user in-process and persist it to DynamoDB if available"""
+    users_db[user.email] = user
+    table = _user_table()
+    if table is None:
+        return
+    try:
+        table.put_item(
+            Item={
+                **_user_key(user.email),
+                "record_type": "user",
+                "email": user.email,
+                "name": user.name,
+                "google_id": user.google_id,
+                "picture": user.picture,
+                "is_active": user.is_active,
+                "is_admin": user.is_admin,
+                "created_at": user.created_at.isoformat(),
+            },
+            ConditionExpression="attribute_not_exists(pk)",
+        )
+    except table.meta.client.exceptions.ConditionalCheckFailedException:
+        logger.info(f"User {user.email} already stored in DynamoDB")
+    except Exception as e:
+        logger.error(f"Error storing user {user.email}: {e}")
+
+
 # User management
 def get_user_by_email(email: str) -> User | None:
     """Get user by email from database"""
-    return users_db.get(email)
+    user = users_db.get(email)
+    if user is not None:
+        return user
+
+    table = _user_table()
+    if table is None:
+        return None
+    try:
+        item = table.get_item(Key=_user_key(email)).get("Item")
+    except Exception as e:
+        logger.error(f"Error loading user {email}: {e}")
+        return None
+    if item is None:
+        return None
+
+    user = User(
+        email=item["email"],
+        name=item["name"],
+        google_id=item["google_id"],
+        picture=item.get("picture"),
+        is_active=item.get("is_active", True),
+        is_admin=item.get("is_admin", False),
+        created_at=datetime.fromisoformat(item["created_at"]),
+    )
+    users_db[email] = user
+    return user
 
 
 def create_user(user_info: dict) -> User:
@@ -126,7 +224,7 @@ def create_user(user_info: dict) -> User:
         google_id=user_info["sub"],
         created_at=datetime.utcnow(),
     )
-    users_db[user.email] = user
+    _save_user(user)
     logger.info(f"Created new user: {user.email}")
     return user
 
@@ -161,7 +259,7 @@ def get_or_create_user(user_info: dict) -> User:
 
     # Store user in database
     logger.info(f"Storing user {email} in users_db (id: {id(users_db)})")
-    users_db[email] = user
+    _save_user(user)
     logger.info(
         f"After storage - users_db length: {len(users_db)}, keys: {list(users_db.keys())}"
     )
@@ -170,6 +268,15 @@ def get_or_create_user(user_info: dict) -> User:
     return user
 
 
+async def _get_user_async(email: str) -> User | None:
+    """get_user_by_email for async code, off the event loop on a cache miss"""
+    user = users_db.get(email)
+    if user is not None:
+        return user
+    # A miss may mean a blocking DynamoDB read
+    return await run_in_threadpool(get_user_by_email, email)
+
+
 # Authentication dependencies
 security = HTTPBearer()
 
@@ -179,7 +286,7 @@ async def get_current_user(
 ) -> User:
     """Get current authenticated user"""
     token_data = verify_token(credentials.credentials)
-    user = get_user_by_email(token_data.email)
+    user = await _get_user_async(token_data.email)
     if user is None:
         raise HTTPException(status_code=401, detail="User not found")
     if not user.is_active:
@@ -210,7 +317,7 @@ async def get_current_user_optional(request: Request) -> User | None:
         if not token_data:
             return None
 
-        user = get_user_by_email(token_data.email)
+        user = await _get_user_async(token_data.email)
         return user if user and user.is_active else None
     except Exception:
         return None
@@ -234,10 +341,19 @@ def is_authorized(request):
     return True
 
 
+@lru_cache(maxsize=8)
+def _authorized_email_set(authorized_emails_str: str) -> frozenset[str]:
+    """Lowercased authorized emails, parsed once per AUTHORIZED_EMAILS value"""
+    if not authorized_emails_str:
+        return frozenset({"development@example.com"})
+    emails = (email.strip().lower() for email in authorized_emails_str.split(","))
+    return frozenset(email for email in emails if email)
+
+
 def is_user_authorized(email):
     """Check if user email is in authorized list"""
-    authorized_emails = get_authorized_emails()
-    return email.lower() in [auth_email.lower() for auth_email in authorized_emails]
+    authorized = _authorized_email_set(os.environ.get("AUTHORIZED_EMAILS", ""))
+    return email.lower() in authorized
 
 
 def get_user_email(request):
@@ -246,12 +362,17 @@ def get_user_email(request):
 
 
 # Admin check
-ADMIN_EMAILS = os.getenv("ADMIN_EMAILS", "").split(",")
+# Normalized once: trimmed, lowercased, blanks dropped
+ADMIN_EMAILS = frozenset(
+    email.strip().lower()
+    for email in os.getenv("ADMIN_EMAILS", "").split(",")
+    if email.strip()
+)
 
 
 async def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
     """Ensure current user is admin"""
-    if current_user.email not in ADMIN_EMAILS:
+    if current_user.email.strip().lower() not in ADMIN_EMAILS:
         raise HTTPException(status_code=403, detail="Admin access required")
     return current_user
 
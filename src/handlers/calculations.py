@@ -1,37 +1,67 @@
-from services.database import DynamoDBService
-from services.google_sheets import GoogleSheetsService
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from services.database import DynamoDBService, get_db_service
+from services.google_sheets import get_sheets_service
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Totals only change when an expenditure is posted (which invalidates them)
+# or the allowance sheet is edited, so serve them from memory for a minute
+_TOTALS_TTL = 60.0
+_totals_cache = {}
+
+# The Sheets fetch and the per-child DynamoDB reads are independent round
+# trips; overlap them instead of paying for each in turn
+_READ_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="totals")
+
 
-def calculate_totals():
+def invalidate_totals():
+    """Drop cached totals so the next call recomputes them"""
+    _totals_cache.clear()
+
+
+def calculate_totals(table=None):
     """Calculate total allowances and expenditures for each child"""
+    # Cached per table handle; None stands for the shared table
+    cached = _totals_cache.get(table)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1]
+
     logger.info("Calculating totals for all children")
 
     try:
-        # Get allowance data from Google Sheets
-        sheets_service = GoogleSheetsService()
-        allowance_data = sheets_service.get_allowance_data()
-
-        # Get expenditure data from DynamoDB
-        db_service = DynamoDBService()
+        sheets_service = get_sheets_service()
+        db_service = DynamoDBService(table) if table is not None else get_db_service()
 
         children = ["child1", "child2", "child3"]
         totals = {}
 
+        # Allowance data from Google Sheets and spent totals from DynamoDB,
+        # fetched concurrently
+        allowance_future = _READ_POOL.submit(sheets_service.get_allowance_data)
+        spent = dict(
+            zip(
+                children,
+                _READ_POOL.map(db_service.get_total_spent, children),
+                strict=True,
+            )
+        )
+        allowance_data = allowance_future.result()
+
+        # Total allowance earned, in one pass over the sheet rows
+        earned = dict.fromkeys(children, 0)
+        for row in allowance_data:
+            if row.get("Before Today", False):
+                for child in children:
+                    earned[child] += row.get(child, 0)
+
         for child in children:
             logger.debug(f"Calculating totals for {child}")
+            total_earned = earned[child]
 
-            # Calculate total allowance earned
-            total_earned = sum(
-                row.get(child, 0)
-                for row in allowance_data
-                if row.get("Before Today", False)
-            )
-
-            # Calculate total spent
-            total_spent = db_service.get_total_spent(child)
+            total_spent = spent[child]
 
             # Calculate balance
             balance = total_earned - total_spent
@@ -47,6 +77,7 @@ def calculate_totals():
             )
 
         logger.info("Successfully calculated totals for all children")
+        _totals_cache[table] = (time.monotonic() + _TOTALS_TTL, totals)
         return totals
 
     except Exception as e:
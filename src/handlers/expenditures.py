@@ -1,24 +1,31 @@
-from services.database import DynamoDBService
-from services.google_sheets import GoogleSheetsService
+from concurrent.futures import ThreadPoolExecutor
+
+from handlers.calculations import invalidate_totals
+from services.database import DynamoDBService, get_db_service
+from services.google_sheets import get_sheets_service
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# The Sheets and DynamoDB writes are independent, so run them side by side
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="expenditure")
+
 
-def post_expenditure(child_name, amount, date, description):
+def post_expenditure(child_name, amount, date, description, table=None):
     """Post expenditure to both Google Sheets and DynamoDB"""
     logger.info(f"Posting expenditure for {child_name}: ${amount}")
 
     try:
-        # Post to Google Sheets
-        sheets_service = GoogleSheetsService()
-        sheets_success = sheets_service.add_expenditure(
-            child_name, amount, date, description
-        )
+        sheets_service = get_sheets_service()
+        db_service = DynamoDBService(table) if table is not None else get_db_service()
 
-        # Post to DynamoDB
-        db_service = DynamoDBService()
+        # Post to Google Sheets and DynamoDB concurrently
+        sheets_future = _WRITE_POOL.submit(
+            sheets_service.add_expenditure, child_name, amount, date, description
+        )
         db_success = db_service.save_expenditure(child_name, amount, date, description)
+        sheets_success = sheets_future.result()
+        invalidate_totals()
 
         if sheets_success and db_success:
             logger.info(f"Successfully posted expenditure for {child_name}")
@@ -32,12 +39,41 @@ def post_expenditure(child_name, amount, date, description):
         return False
 
 
+def post_expenditures(expenditures, table=None):
+    """Post (child_name, amount, date, description) tuples in bulk"""
+    expenditures = list(expenditures)
+    logger.info(f"Posting {len(expenditures)} expenditures")
+
+    try:
+        sheets_service = get_sheets_service()
+        db_service = DynamoDBService(table) if table is not None else get_db_service()
+
+        # One Sheets append and batched DynamoDB writes, run concurrently
+        sheets_future = _WRITE_POOL.submit(
+            sheets_service.add_expenditures, expenditures
+        )
+        db_success = db_service.save_expenditures(expenditures)
+        sheets_success = sheets_future.result()
+        invalidate_totals()
+
+        if sheets_success and db_success:
+            logger.info(f"Successfully posted {len(expenditures)} expenditures")
+            return True
+        else:
+            logger.warning("Partial failure posting expenditures")
+            return False
+
+    except Exception as e:
+        logger.error(f"Error posting expenditures: {e}")
+        return False
+
+
 def get_expenditures():
     """Get expenditures from DynamoDB"""
     logger.info("Retrieving all expenditures")
 
     try:
-        db_service = DynamoDBService()
+        db_service = get_db_service()
         expenditures = db_service.get_expenditures()
         logger.info(f"Retrieved {len(expenditures)} expenditures")
         return expenditures
@@ -1,8 +1,12 @@
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, eq=False)
 class Child:
-    def __init__(self, name: str, total_earnings: float = 0.0):
-        self.name = name
-        self.total_earnings = total_earnings
-        self.expenditures = []
+    name: str
+    total_earnings: float = 0.0
+    expenditures: list = field(default_factory=list, init=False)
 
     def add_expenditure(self, expenditure):
         """Add an expenditure to this child's record"""
@@ -10,7 +14,7 @@ class Child:
 
     def get_total_spent(self) -> float:
         """Calculate total amount spent by this child"""
-        return sum(exp.amount for exp in self.expenditures)
+        return math.fsum(exp.amount for exp in self.expenditures)
 
     def get_balance(self) -> float:
         """Calculate remaining balance"""
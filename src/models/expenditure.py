@@ -1,11 +1,16 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
+@dataclass(slots=True, eq=False)
 class Expenditure:
-    def __init__(self, amount: float, description: str, date: str | None = None):
-        self.amount = amount
-        self.description = description
-        self.date = date or datetime.now().strftime("%Y-%m-%d")
+    amount: float
+    description: str
+    date: str | None = None
+    created_at: datetime = field(init=False)
+
+    def __post_init__(self):
+        self.date = self.date or datetime.now().strftime("%Y-%m-%d")
         self.created_at = datetime.now()
 
     def __repr__(self):
@@ -1,28 +1,99 @@
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import cache
 
 import boto3
+from botocore.config import Config
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# GSI keyed on record_type + created_at (see infrastructure/cloudformation.yaml)
+RECORD_TYPE_INDEX = "record_type-index"
+
+# Keep pooled connections alive between calls so small reads and writes don't
+# pay a fresh TCP/TLS handshake each time
+_BOTO_CONFIG = Config(
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    max_pool_connections=50,
+    tcp_keepalive=True,
+)
+
+
+def _dynamodb_resource():
+    """Return a DynamoDB resource, routed through DAX when DAX_ENDPOINT is set"""
+    dax_endpoint = os.environ.get("DAX_ENDPOINT")
+    if dax_endpoint:
+        try:
+            from amazondax import AmazonDaxClient
+
+            logger.info(f"Routing DynamoDB calls through DAX at {dax_endpoint}")
+            return AmazonDaxClient.resource(endpoint_url=dax_endpoint)
+        except ImportError:
+            logger.warning("DAX_ENDPOINT is set but amazon-dax-client is missing")
+    return boto3.resource("dynamodb", config=_BOTO_CONFIG)
+
+
+# Build the Table handle once per process; boto3 resource construction loads
+# the service model, which is too slow to repeat on every request
+try:
+    _TABLE = _dynamodb_resource().Table(
+        os.environ.get("DYNAMODB_TABLE", "allowance-data-dev")
+    )
+except Exception as e:
+    logger.warning(f"Failed to initialize DynamoDB, using mock mode: {e}")
+    _TABLE = None
+
+
+def get_table():
+    """Return the shared Table handle, or None when DynamoDB is unavailable"""
+    return _TABLE
+
 
 class DynamoDBService:
-    def __init__(self):
+    def __init__(self, table=None):
         logger.info("Initializing DynamoDB service")
-        # For development, create mock service if no AWS credentials
-        try:
-            self.dynamodb = boto3.resource("dynamodb")
-            self.table_name = os.environ.get("DYNAMODB_TABLE", "allowance-data-dev")
-            self.table = self.dynamodb.Table(self.table_name)
-            self.mock_mode = False
-            logger.info(f"DynamoDB service initialized with table: {self.table_name}")
-        except Exception as e:
-            logger.warning(f"Failed to initialize DynamoDB, using mock mode: {e}")
+        # Reuse a Table handle (and its connection pool) owned by the caller,
+        # falling back to the module-level one
+        if table is None:
+            table = _TABLE
+
+        # For development, use a mock service if no AWS credentials
+        if table is None:
             self.mock_mode = True
             self.mock_data = []
+            return
+
+        self.table = table
+        self.table_name = table.name
+        self.mock_mode = False
+        logger.info(f"DynamoDB service initialized with table: {self.table_name}")
+
+    def _query_pages(self, **kwargs):
+        """Yield each page of a query, following LastEvaluatedKey"""
+        response = self.table.query(**kwargs)
+        yield response["Items"]
+        while "LastEvaluatedKey" in response:
+            response = self.table.query(
+                ExclusiveStartKey=response["LastEvaluatedKey"], **kwargs
+            )
+            yield response["Items"]
+
+    def _scan_pages(self, **kwargs):
+        """Yield each page of a scan, following LastEvaluatedKey"""
+        response = self.table.scan(**kwargs)
+        yield response["Items"]
+        while "LastEvaluatedKey" in response:
+            response = self.table.scan(
+                ExclusiveStartKey=response["LastEvaluatedKey"], **kwargs
+            )
+            yield response["Items"]
+
+    def _query_all(self, **kwargs):
+        """Run a query and collect every page"""
+        return [item for page in self._query_pages(**kwargs) for item in page]
 
     def save_expenditure(self, child_name, amount, date, description):
         """Save expenditure to DynamoDB"""
@@ -39,22 +110,100 @@ class DynamoDBService:
             return True
 
         try:
-            item = {
-                "pk": f"CHILD#{child_name}",
-                "sk": f"EXPENDITURE#{datetime.now().isoformat()}",
-                "amount": Decimal(str(amount)),
-                "date": date,
-                "description": description,
-                "created_at": datetime.now().isoformat(),
-            }
-
-            self.table.put_item(Item=item)
+            self._transact_expenditures([(child_name, amount, date, description)])
             logger.info(f"Saved expenditure for {child_name}: ${amount}")
             return True
         except Exception as e:
             logger.error(f"Error saving expenditure: {e}")
             return False
 
+    def save_expenditures(self, expenditures):
+        """Save (child_name, amount, date, description) tuples in bulk
+
+        Expenditures are written in transactions of up to 100 actions, each
+        carrying its own TOTAL updates, so a failure partway through leaves
+        every committed group and its totals consistent.
+        """
+        if self.mock_mode:
+            return all(self.save_expenditure(*exp) for exp in expenditures)
+
+        count = 0
+        try:
+            for group in _transaction_groups(expenditures):
+                self._transact_expenditures(group)
+                count += len(group)
+            logger.info(f"Saved {count} expenditures")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving expenditures after {count} were saved: {e}")
+            return False
+
+    def _transact_expenditures(self, expenditures):
+        """Put expenditures and ADD them to their TOTAL items in one transaction
+
+        The put and the ADD commit or fail together, so a TOTAL never drifts
+        from the expenditures it sums. The sort key is a timestamp; a put that
+        collides with an existing expenditure cancels the transaction, which
+        is retried once with fresh timestamps.
+        """
+        client = self.table.meta.client
+        for attempt in range(2):
+            try:
+                client.transact_write_items(
+                    TransactItems=self._transact_items(expenditures)
+                )
+                return
+            except client.exceptions.TransactionCanceledException:
+                if attempt:
+                    raise
+
+    def _transact_items(self, expenditures):
+        now = datetime.now()
+        added = {}
+        actions = []
+        for i, exp in enumerate(expenditures):
+            # Distinct stamps, so a bulk save never collides with itself
+            created_at = (now + timedelta(microseconds=i)).isoformat()
+            item = self._expenditure_item(*exp, created_at=created_at)
+            actions.append(
+                {
+                    "Put": {
+                        "TableName": self.table_name,
+                        "Item": item,
+                        "ConditionExpression": "attribute_not_exists(sk)",
+                    }
+                }
+            )
+            amount, count = added.get(exp[0], (Decimal(0), 0))
+            added[exp[0]] = (amount + item["amount"], count + 1)
+
+        # One update per child; a transaction can't touch an item twice
+        for child_name, (amount, count) in added.items():
+            actions.append(
+                {
+                    "Update": {
+                        "TableName": self.table_name,
+                        "Key": _total_key(child_name),
+                        "UpdateExpression": "ADD amount :v, expenditure_count :n",
+                        "ExpressionAttributeValues": {":v": amount, ":n": count},
+                    }
+                }
+            )
+        return actions
+
+    @staticmethod
+    def _expenditure_item(child_name, amount, date, description, created_at=None):
+        created_at = created_at or datetime.now().isoformat()
+        return {
+            "pk": f"CHILD#{child_name}",
+            "sk": f"EXPENDITURE#{created_at}",
+            "record_type": "expenditure",
+            "amount": Decimal(str(amount)),
+            "date": date,
+            "description": description,
+            "created_at": created_at,
+        }
+
     def get_expenditures(self, child_name=None):
         """Get expenditures from DynamoDB"""
         if self.mock_mode:
@@ -68,35 +217,232 @@ class DynamoDBService:
             return self.mock_data
 
         try:
-            if child_name:
-                response = self.table.query(
-                    KeyConditionExpression="pk = :pk AND begins_with(sk, :sk)",
-                    ExpressionAttributeValues={
-                        ":pk": f"CHILD#{child_name}",
-                        ":sk": "EXPENDITURE#",
-                    },
-                )
-            else:
-                response = self.table.scan(
-                    FilterExpression="begins_with(sk, :sk)",
-                    ExpressionAttributeValues={":sk": "EXPENDITURE#"},
-                )
-
-            # Convert Decimal to float for JSON serialization
-            items = []
-            for item in response["Items"]:
-                item["amount"] = float(item["amount"])
-                items.append(item)
-
+            items = list(self.iter_expenditures(child_name))
             logger.info(f"Retrieved {len(items)} expenditures from DynamoDB")
             return items
         except Exception as e:
             logger.error(f"Error getting expenditures: {e}")
             return []
 
+    def iter_expenditures(self, child_name=None, page_size=None):
+        """Yield expenditures one query page at a time
+
+        Memory stays bounded by the page size, so large histories can be
+        streamed out without materializing the whole result. Errors are
+        raised to the caller.
+        """
+        if self.mock_mode:
+            for exp in self.mock_data:
+                if not child_name or exp["child"] == child_name:
+                    yield exp
+            return
+
+        if child_name:
+            query = {
+                "KeyConditionExpression": "pk = :pk AND begins_with(sk, :sk)",
+                "ExpressionAttributeValues": {
+                    ":pk": f"CHILD#{child_name}",
+                    ":sk": "EXPENDITURE#",
+                },
+            }
+        else:
+            query = {
+                "IndexName": RECORD_TYPE_INDEX,
+                "KeyConditionExpression": "record_type = :type",
+                "ExpressionAttributeValues": {":type": "expenditure"},
+            }
+        # sk and record_type only repeat created_at and the query itself;
+        # pk stays since it is the only record of which child spent it
+        query["ProjectionExpression"] = "pk, amount, #d, description, created_at"
+        query["ExpressionAttributeNames"] = {"#d": "date"}
+        if page_size:
+            query["Limit"] = page_size
+
+        for page in self._query_pages(**query):
+            for item in page:
+                # Convert Decimal to float for JSON serialization
+                item["amount"] = float(item["amount"])
+                yield item
+
+    def backfill_record_types(self):
+        """Tag expenditures written before record_type existed
+
+        The all-children listing queries the record_type GSI, which only
+        sees items carrying record_type. Run once per table (see
+        scripts/backfill_record_types.py); rerunning is harmless. Returns the
+        number of items tagged.
+        """
+        if self.mock_mode:
+            return 0
+
+        conditional_failed = (
+            self.table.meta.client.exceptions.ConditionalCheckFailedException
+        )
+        tagged = 0
+        for page in self._scan_pages(
+            FilterExpression="begins_with(sk, :sk) AND attribute_not_exists(record_type)",
+            ExpressionAttributeValues={":sk": "EXPENDITURE#"},
+            ProjectionExpression="pk, sk",
+        ):
+            for key in page:
+                try:
+                    # Never recreate an item deleted since the scan read it
+                    self.table.update_item(
+                        Key=key,
+                        UpdateExpression="SET record_type = :type",
+                        ConditionExpression="attribute_exists(pk)",
+                        ExpressionAttributeValues={":type": "expenditure"},
+                    )
+                    tagged += 1
+                except conditional_failed:
+                    continue
+        logger.info(f"Tagged {tagged} expenditures with record_type")
+        return tagged
+
     def get_total_spent(self, child_name):
         """Calculate total spent by a child"""
-        expenditures = self.get_expenditures(child_name)
-        total = sum(exp["amount"] for exp in expenditures)
+        if self.mock_mode:
+            expenditures = self.get_expenditures(child_name)
+            total = sum(exp["amount"] for exp in expenditures)
+            logger.debug(f"Total spent by {child_name}: ${total}")
+            return total
+
+        try:
+            # Every write keeps the TOTAL item current, so once it has been
+            # backfilled this is one point read
+            item = self.table.get_item(
+                Key=_total_key(child_name), ProjectionExpression="amount, seeded"
+            ).get("Item")
+            if item is not None and item.get("seeded"):
+                total = float(item["amount"])
+            else:
+                # Not backfilled yet; the TOTAL may miss older expenditures
+                total = float(self._sum_expenditures(child_name)[0])
+        except Exception as e:
+            logger.error(f"Error getting total spent: {e}")
+            return 0
+
         logger.debug(f"Total spent by {child_name}: ${total}")
         return total
+
+    def _sum_expenditures(self, child_name, consistent=False):
+        """Sum and count a child's expenditures from its full history"""
+        # Only the amounts are needed, so don't pull whole items over the wire
+        items = self._query_all(
+            KeyConditionExpression="pk = :pk AND begins_with(sk, :sk)",
+            ExpressionAttributeValues={
+                ":pk": f"CHILD#{child_name}",
+                ":sk": "EXPENDITURE#",
+            },
+            ProjectionExpression="amount",
+            ConsistentRead=consistent,
+        )
+        # Sum the Decimals exactly and convert once at the boundary
+        return sum((item["amount"] for item in items), Decimal(0)), len(items)
+
+    def backfill_totals(self, child_names=None):
+        """Seed TOTAL items from each child's expenditure history
+
+        Run once per table (see scripts/backfill_totals.py) so get_total_spent
+        can trust the TOTAL items; rerunning is harmless. Defaults to every
+        child with an EXPENDITURE# item, found by a table scan so legacy items
+        without record_type (invisible to the GSI) are included. Returns the
+        seeded totals by child.
+        """
+        if self.mock_mode:
+            return {}
+
+        if child_names is None:
+            child_names = sorted(
+                {
+                    item["pk"].removeprefix("CHILD#")
+                    for page in self._scan_pages(
+                        FilterExpression="begins_with(sk, :sk)",
+                        ExpressionAttributeValues={":sk": "EXPENDITURE#"},
+                        ProjectionExpression="pk",
+                    )
+                    for item in page
+                }
+            )
+        totals = {}
+        for child_name in child_names:
+            totals[child_name] = float(self._backfill_total(child_name))
+            logger.info(f"Seeded total for {child_name}: ${totals[child_name]}")
+        return totals
+
+    def _backfill_total(self, child_name, attempts=5):
+        """Store a child's summed history as its TOTAL, without losing writes
+
+        Every write bumps expenditure_count, so the seed is conditioned on the
+        count read before summing; if a write lands in between, the put fails
+        and the sum is redone.
+        """
+        conditional_failed = (
+            self.table.meta.client.exceptions.ConditionalCheckFailedException
+        )
+        key = _total_key(child_name)
+        for _ in range(attempts):
+            current = self.table.get_item(
+                Key=key, ProjectionExpression="expenditure_count", ConsistentRead=True
+            ).get("Item")
+            total, count = self._sum_expenditures(child_name, consistent=True)
+
+            if current is None:
+                condition = {"ConditionExpression": "attribute_not_exists(pk)"}
+            elif "expenditure_count" not in current:
+                condition = {
+                    "ConditionExpression": "attribute_not_exists(expenditure_count)"
+                }
+            else:
+                condition = {
+                    "ConditionExpression": "expenditure_count = :seen",
+                    "ExpressionAttributeValues": {
+                        ":seen": current["expenditure_count"]
+                    },
+                }
+            try:
+                self.table.put_item(
+                    Item={
+                        **key,
+                        "amount": total,
+                        "expenditure_count": count,
+                        "seeded": True,
+                    },
+                    **condition,
+                )
+                return total
+            except conditional_failed:
+                continue
+        raise RuntimeError(f"Total for {child_name} kept changing during backfill")
+
+
+def _total_key(child_name):
+    """Key of the per-child aggregate item holding the running spent total"""
+    return {"pk": f"CHILD#{child_name}", "sk": "TOTAL"}
+
+
+# TransactWriteItems takes at most 100 actions
+_MAX_TRANSACT_ACTIONS = 100
+
+
+def _transaction_groups(expenditures):
+    """Split expenditures into groups that each fit in one transaction
+
+    A group needs one put per expenditure plus one TOTAL update per child.
+    """
+    group, children = [], set()
+    for exp in expenditures:
+        # Actions once exp is added: its put, the existing puts, and updates
+        if len(group) + 1 + len(children | {exp[0]}) > _MAX_TRANSACT_ACTIONS:
+            yield group
+            group, children = [], set()
+        group.append(exp)
+        children.add(exp[0])
+    if group:
+        yield group
+
+
+@cache
+def get_db_service():
+    """Return the process-wide DynamoDBService bound to the module-level table"""
+    return DynamoDBService()
@@ -1,17 +1,28 @@
 import json
 import os
-
-import gspread
-from google.oauth2.service_account import Credentials
+import time
+from functools import cache
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Allowance rows change about once a week, so reads are served from memory
+# for a few minutes; keyed by sheet id -> (expires_at, records)
+_ALLOWANCE_TTL = 300.0
+_allowance_cache = {}
+
+
+def invalidate_allowance_cache():
+    """Forget cached allowance data, e.g. after editing the allowance sheet"""
+    _allowance_cache.clear()
+
+
 class GoogleSheetsService:
     def __init__(self):
         logger.info("Initializing Google Sheets service")
+        self._spreadsheet = None
         scope = [
             "https://spreadsheets.google.com/feeds",
             "https://www.googleapis.com/auth/drive",
@@ -26,6 +37,11 @@ class GoogleSheetsService:
             return
 
         try:
+            # gspread and google-auth are only imported when Sheets is
+            # configured; mock mode never pays for them
+            import gspread
+            from google.oauth2.service_account import Credentials
+
             service_account_info = json.loads(service_account_json)
 
             creds = Credentials.from_service_account_info(
@@ -40,6 +56,12 @@ class GoogleSheetsService:
             self.client = None
             self.sheet_id = None
 
+    def _open(self):
+        """Open the spreadsheet once; open_by_key costs a metadata round trip"""
+        if self._spreadsheet is None:
+            self._spreadsheet = self.client.open_by_key(self.sheet_id)
+        return self._spreadsheet
+
     def get_allowance_data(self):
         if not self.client:
             logger.info("Using mock allowance data")
@@ -60,10 +82,15 @@ class GoogleSheetsService:
                 },
             ]
 
+        cached = _allowance_cache.get(self.sheet_id)
+        if cached and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
-            sheet = self.client.open_by_key(self.sheet_id).worksheet("Allowance Earned")
+            sheet = self._open().worksheet("Allowance Earned")
             data = sheet.get_all_records()
             logger.info(f"Retrieved {len(data)} allowance records")
+            _allowance_cache[self.sheet_id] = (time.monotonic() + _ALLOWANCE_TTL, data)
             return data
         except Exception as e:
             logger.error(f"Error retrieving allowance data: {e}")
@@ -75,7 +102,7 @@ class GoogleSheetsService:
             return []
 
         try:
-            sheet = self.client.open_by_key(self.sheet_id).worksheet("Sheet1")
+            sheet = self._open().worksheet("Sheet1")
             data = sheet.get_all_records()
             logger.info(f"Retrieved {len(data)} expenditure records")
             return data
@@ -91,10 +118,31 @@ class GoogleSheetsService:
             return True
 
         try:
-            sheet = self.client.open_by_key(self.sheet_id).worksheet("Sheet1")
+            sheet = self._open().worksheet("Sheet1")
             sheet.append_row([who, cost, date, description])
             logger.info(f"Added expenditure for {who}: ${cost}")
             return True
         except Exception as e:
             logger.error(f"Error adding expenditure: {e}")
             return False
+
+    def add_expenditures(self, rows):
+        """Append several [who, cost, date, description] rows in one request"""
+        if not self.client:
+            logger.info(f"Mock: Adding {len(rows)} expenditures")
+            return True
+
+        try:
+            sheet = self._open().worksheet("Sheet1")
+            sheet.append_rows([list(row) for row in rows])
+            logger.info(f"Added {len(rows)} expenditures")
+            return True
+        except Exception as e:
+            logger.error(f"Error adding expenditures: {e}")
+            return False
+
+
+@cache
+def get_sheets_service():
+    """Return the process-wide GoogleSheetsService; authorizing is not cheap"""
+    return GoogleSheetsService()
@@ -1,35 +1,11 @@
 import functools
-import os
 import time
-from functools import wraps
-
-from flask import abort, request
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-def requires_auth(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        auth_token = request.headers.get("Authorization")
-        if not auth_token or auth_token != os.getenv("AUTH_TOKEN"):
-            abort(403)  # Forbidden
-        return f(*args, **kwargs)
-
-    return decorated
-
-
-def log_request(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        print(f"Request made to {request.path} with method {request.method}")
-        return f(*args, **kwargs)
-
-    return decorated
-
-
 def timing_decorator(func):
     """Decorator to measure function execution time"""
 
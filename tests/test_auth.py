@@ -1,19 +1,21 @@
 """Tests for authentication module"""
 
+import threading
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
+import jwt
 import pytest
 from fastapi import HTTPException
 from fastapi.security import HTTPAuthorizationCredentials
 from freezegun import freeze_time
-from jose import jwt  # Changed from 'import jwt' to 'from jose import jwt'
 
 from handlers.auth import (
     ALGORITHM,
     SECRET_KEY,
     TokenData,
     User,
+    _user_table,
     create_access_token,
     create_user,
     get_authorized_emails,
@@ -107,6 +109,17 @@ class TestJWTFunctions:
         assert exc_info.value.status_code == 401
         assert "Invalid token" in exc_info.value.detail
 
+    def test_verify_token_reuses_cached_result(self):
+        """Test that a verified token is not decoded again while cached"""
+        token = create_access_token({"sub": "cache@example.com", "google_id": "42"})
+        first = verify_token(token)
+
+        with patch("handlers.auth.jwt.decode") as mock_decode:
+            second = verify_token(token)
+
+        mock_decode.assert_not_called()
+        assert second == first
+
 
 class TestUserManagement:
     """Test user management functions"""
@@ -179,6 +192,38 @@ class TestUserManagement:
         assert result.google_id == "789012"
         assert users_db["new@example.com"] == result
 
+    def test_users_persist_across_cold_starts(self):
+        """Test that users stored in DynamoDB are reloaded after users_db resets"""
+        items = {}
+        table = Mock()
+        table.put_item.side_effect = lambda Item, **kw: items.update(
+            {(Item["pk"], Item["sk"]): Item}
+        )
+        table.get_item.side_effect = lambda Key: (
+            {"Item": items[(Key["pk"], Key["sk"])]}
+            if (Key["pk"], Key["sk"]) in items
+            else {}
+        )
+
+        with patch("handlers.auth._user_table", return_value=table):
+            created = get_or_create_user(
+                {"email": "kept@example.com", "name": "Kept", "sub": "555"}
+            )
+            users_db.clear()
+            loaded = get_user_by_email("kept@example.com")
+
+        assert loaded == created
+        assert items[("USER#kept@example.com", "PROFILE")]["record_type"] == "user"
+
+    def test_user_table_follows_dynamodb_table_env(self, monkeypatch):
+        """Test that the user table is resolved on every call"""
+        table = Mock()
+        with patch("services.database.get_table", return_value=table):
+            monkeypatch.delenv("DYNAMODB_TABLE", raising=False)
+            assert _user_table() is None
+            monkeypatch.setenv("DYNAMODB_TABLE", "allowance-data-test")
+            assert _user_table() is table
+
 
 class TestAuthenticationDependencies:
     """Test FastAPI dependency functions"""
@@ -201,6 +246,34 @@ class TestAuthenticationDependencies:
         result = await get_current_user(credentials)
         assert result == user
 
+    @pytest.mark.asyncio
+    async def test_get_current_user_loads_off_event_loop(self):
+        """Test that a users_db miss reads DynamoDB in a worker thread"""
+        loop_thread = threading.get_ident()
+        lookup_threads = []
+        table = Mock()
+
+        def get_item(Key):
+            lookup_threads.append(threading.get_ident())
+            return {
+                "Item": {
+                    "email": "stored@example.com",
+                    "name": "Stored",
+                    "google_id": "321",
+                    "created_at": "2025-01-01T00:00:00",
+                }
+            }
+
+        table.get_item.side_effect = get_item
+        token = create_access_token({"sub": "stored@example.com", "google_id": "321"})
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+
+        with patch("handlers.auth._user_table", return_value=table):
+            result = await get_current_user(credentials)
+
+        assert result.email == "stored@example.com"
+        assert lookup_threads and lookup_threads[0] != loop_thread
+
     @pytest.mark.asyncio
     async def test_get_current_user_invalid_token(self):
         """Test getting current user with invalid token"""
@@ -323,6 +396,20 @@ class TestAuthenticationDependencies:
             assert exc_info.value.status_code == 403
             assert "Admin access required" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_admin_emails_normalized(self):
+        """Test that padded, mixed-case and blank ADMIN_EMAILS entries normalize"""
+        with patch.dict("os.environ", {"ADMIN_EMAILS": " Admin@Example.com ,, "}):
+            import importlib
+
+            import handlers.auth
+
+            importlib.reload(handlers.auth)
+
+            assert handlers.auth.ADMIN_EMAILS == frozenset({"admin@example.com"})
+            user = User(email="ADMIN@example.com", name="Admin", google_id="1")
+            assert await handlers.auth.get_admin_user(user) is user
+
 
 class TestLegacyAuthFunctions:
     """Test backward compatibility functions"""
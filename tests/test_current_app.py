@@ -1,5 +1,7 @@
 """Test the current app functionality without auth requirements"""
 
+from decimal import Decimal
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -70,6 +72,142 @@ class TestCurrentAppFunctionality:
             assert data["name"] == "Test Child"
             assert "id" in data
 
+    def test_child_ids_not_reused_after_delete(self, client):
+        """Test that deleting a child does not hand its id to the next one"""
+        child_data = {"name": "Temp Child", "age": 7, "weekly_allowance": 3.0}
+        first = client.post("/children", json=child_data).json()
+        assert client.delete(f"/children/{first['id']}").status_code == 200
+
+        second = client.post("/children", json=child_data).json()
+        assert second["id"] != first["id"]
+        assert client.get(f"/children/{first['id']}").status_code == 404
+
+    def test_transactions_filtered_by_child(self, client):
+        """Test that transactions can be listed for a single child"""
+        child_data = {"name": "Saver", "age": 9, "weekly_allowance": 4.0}
+        child = client.post("/children", json=child_data).json()
+        client.post(
+            "/transactions",
+            json={
+                "child_id": child["id"],
+                "amount": 4.0,
+                "description": "Weekly allowance",
+                "transaction_type": "allowance",
+            },
+        )
+
+        response = client.get("/transactions", params={"child_id": child["id"]})
+        assert response.status_code == 200
+        assert [t["child_id"] for t in response.json()] == [child["id"]]
+        assert client.get(f"/children/{child['id']}").json()["current_balance"] == 4.0
+
+    def test_summary_totals_track_transactions(self, client):
+        """Test that summary totals move with new transactions and chores"""
+        before = client.get("/reports/summary").json()["summary"]
+
+        child_data = {"name": "Spender", "age": 10, "weekly_allowance": 5.0}
+        child = client.post("/children", json=child_data).json()
+        for amount, kind in [(5.0, "allowance"), (2.0, "spending")]:
+            client.post(
+                "/transactions",
+                json={
+                    "child_id": child["id"],
+                    "amount": amount,
+                    "description": kind,
+                    "transaction_type": kind,
+                },
+            )
+        chore_data = {
+            "name": "Dishes",
+            "description": "Wash up",
+            "value": 1.5,
+            "assigned_to": child["id"],
+        }
+        chore = client.post("/chores", json=chore_data).json()
+        client.put(f"/chores/{chore['id']}/complete")
+
+        after = client.get("/reports/summary").json()["summary"]
+        assert after["total_allowances_paid"] - before["total_allowances_paid"] == 5.0
+        assert after["total_spending"] - before["total_spending"] == 2.0
+        assert after["total_chore_earnings"] - before["total_chore_earnings"] == 1.5
+        assert after["completed_chores"] - before["completed_chores"] == 1
+        assert after["total_balances"] - before["total_balances"] == 4.5
+
+    def test_summary_totals_survive_create_delete_round_trip(self, client):
+        """Test that money totals don't drift as children come and go"""
+        before = client.get("/reports/summary").json()["summary"]
+
+        children = [
+            client.post(
+                "/children",
+                json={
+                    "name": f"Saver {i}",
+                    "age": 9,
+                    "weekly_allowance": 1.0,
+                    "current_balance": balance,
+                },
+            ).json()
+            for i, balance in enumerate([0.1, 0.2])
+        ]
+        for amount in (0.1, 0.2):
+            client.post(
+                "/transactions",
+                json={
+                    "child_id": children[0]["id"],
+                    "amount": amount,
+                    "description": "Allowance",
+                    "transaction_type": "allowance",
+                },
+            )
+        for child in children:
+            client.delete(f"/children/{child['id']}")
+
+        after = client.get("/reports/summary").json()["summary"]
+        assert after["total_balances"] == before["total_balances"]
+        paid = Decimal(str(after["total_allowances_paid"])) - Decimal(
+            str(before["total_allowances_paid"])
+        )
+        assert paid == Decimal("0.3")
+
+    def test_chores_filtered_by_assignee_and_status(self, client):
+        """Test that chore filters follow assignment and completion"""
+        child_data = {"name": "Helper", "age": 11, "weekly_allowance": 6.0}
+        child = client.post("/children", json=child_data).json()
+        chores = [
+            client.post(
+                "/chores",
+                json={
+                    "name": name,
+                    "description": name,
+                    "value": 1.0,
+                    "assigned_to": child["id"],
+                },
+            ).json()
+            for name in ["Sweep", "Dust"]
+        ]
+        client.put(f"/chores/{chores[0]['id']}/complete")
+
+        def chore_ids(**params):
+            response = client.get("/chores", params=params)
+            assert response.status_code == 200
+            return [c["id"] for c in response.json()]
+
+        assert chore_ids(assigned_to=child["id"]) == [c["id"] for c in chores]
+        assert chore_ids(assigned_to=child["id"], completed=True) == [chores[0]["id"]]
+        assert chore_ids(assigned_to=child["id"], completed=False) == [chores[1]["id"]]
+        assert chores[0]["id"] in chore_ids(completed=True)
+        assert chores[0]["id"] not in chore_ids(completed=False)
+
+    def test_ui_revalidates_with_etag(self, client):
+        """Test that /ui answers a matching If-None-Match with 304"""
+        response = client.get("/ui")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        cached = client.get("/ui", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
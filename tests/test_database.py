@@ -0,0 +1,302 @@
+"""Tests for the DynamoDB service"""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from services.database import DynamoDBService
+
+
+class ConditionalCheckFailedException(Exception):
+    pass
+
+
+class TransactionCanceledException(Exception):
+    pass
+
+
+@pytest.fixture
+def table():
+    """Mock Table with the client exceptions the service catches"""
+    table = Mock()
+    table.name = "allowance-test"
+    exceptions = table.meta.client.exceptions
+    exceptions.ConditionalCheckFailedException = ConditionalCheckFailedException
+    exceptions.TransactionCanceledException = TransactionCanceledException
+    return table
+
+
+def _transactions(table):
+    """TransactItems of every transact_write_items call, in order"""
+    transact = table.meta.client.transact_write_items
+    return [call.kwargs["TransactItems"] for call in transact.call_args_list]
+
+
+def _updates(actions):
+    return {
+        action["Update"]["Key"]["pk"]: action["Update"]["ExpressionAttributeValues"]
+        for action in actions
+        if "Update" in action
+    }
+
+
+class TestSaveExpenditure:
+    """Test single expenditure writes"""
+
+    def test_put_and_total_in_one_transaction(self, table):
+        """The expenditure and its TOTAL ADD commit together"""
+        service = DynamoDBService(table)
+
+        assert service.save_expenditure("child1", 2.5, "2025-01-01", "Candy")
+
+        (actions,) = _transactions(table)
+        put, update = actions
+        assert put["Put"]["Item"]["pk"] == "CHILD#child1"
+        assert put["Put"]["Item"]["amount"] == Decimal("2.5")
+        assert put["Put"]["ConditionExpression"] == "attribute_not_exists(sk)"
+        assert update["Update"]["Key"] == {"pk": "CHILD#child1", "sk": "TOTAL"}
+        assert update["Update"]["UpdateExpression"] == (
+            "ADD amount :v, expenditure_count :n"
+        )
+        # Unconditional, so the first spend creates the TOTAL item
+        assert "ConditionExpression" not in update["Update"]
+        table.put_item.assert_not_called()
+        table.update_item.assert_not_called()
+
+    def test_cancelled_transaction_retried_once(self, table):
+        """A sort-key collision is retried with a fresh timestamp"""
+        table.meta.client.transact_write_items.side_effect = [
+            TransactionCanceledException(),
+            {},
+        ]
+        service = DynamoDBService(table)
+
+        assert service.save_expenditure("child1", 1, "2025-01-01", "Candy")
+        assert table.meta.client.transact_write_items.call_count == 2
+
+    def test_repeated_cancellation_returns_false(self, table):
+        """Neither the expenditure nor the total is written"""
+        table.meta.client.transact_write_items.side_effect = (
+            TransactionCanceledException()
+        )
+        service = DynamoDBService(table)
+
+        assert not service.save_expenditure("child1", 1, "2025-01-01", "Candy")
+        assert table.meta.client.transact_write_items.call_count == 2
+
+
+class TestSaveExpenditures:
+    """Test bulk expenditure writes"""
+
+    def test_totals_summed_per_child(self, table):
+        """Each child gets one ADD of its summed amounts and count"""
+        service = DynamoDBService(table)
+
+        assert service.save_expenditures(
+            [
+                ("child1", 1.5, "2025-01-01", "Candy"),
+                ("child2", 3, "2025-01-02", "Book"),
+                ("child1", 2.25, "2025-01-03", "Toy"),
+            ]
+        )
+
+        (actions,) = _transactions(table)
+        puts = [action["Put"]["Item"] for action in actions if "Put" in action]
+        assert [item["pk"] for item in puts] == [
+            "CHILD#child1",
+            "CHILD#child2",
+            "CHILD#child1",
+        ]
+        assert len({item["sk"] for item in puts}) == 3
+        assert _updates(actions) == {
+            "CHILD#child1": {":v": Decimal("3.75"), ":n": 2},
+            "CHILD#child2": {":v": Decimal("3"), ":n": 1},
+        }
+
+    def test_large_batches_split_into_transactions(self, table):
+        """No transaction exceeds 100 actions"""
+        service = DynamoDBService(table)
+        expenditures = [
+            (f"child{i % 3}", 1, "2025-01-01", f"Item {i}") for i in range(250)
+        ]
+
+        assert service.save_expenditures(expenditures)
+
+        transactions = _transactions(table)
+        assert all(len(actions) <= 100 for actions in transactions)
+        assert sum(
+            len([a for a in actions if "Put" in a]) for actions in transactions
+        ) == len(expenditures)
+        total = sum(
+            values[":v"]
+            for actions in transactions
+            for values in _updates(actions).values()
+        )
+        assert total == Decimal(250)
+
+    def test_failed_group_keeps_earlier_groups_consistent(self, table):
+        """A failure partway leaves only whole groups, each with its totals"""
+        table.meta.client.transact_write_items.side_effect = [
+            {},
+            RuntimeError("throttled"),
+        ]
+        service = DynamoDBService(table)
+        expenditures = [("child1", 1, "2025-01-01", f"Item {i}") for i in range(150)]
+
+        assert not service.save_expenditures(expenditures)
+
+        committed = _transactions(table)[0]
+        puts = [action for action in committed if "Put" in action]
+        assert _updates(committed)["CHILD#child1"] == {
+            ":v": Decimal(len(puts)),
+            ":n": len(puts),
+        }
+
+    def test_mock_mode_saves_each_expenditure(self):
+        """Without a table the expenditures land in the mock store"""
+        with patch("services.database._TABLE", None):
+            service = DynamoDBService()
+
+        assert service.save_expenditures(
+            [
+                ("child1", 1, "2025-01-01", "Candy"),
+                ("child2", 2, "2025-01-02", "Book"),
+            ]
+        )
+        assert service.get_total_spent("child1") == 1.0
+        assert service.get_total_spent("child2") == 2.0
+
+
+class TestGetTotalSpent:
+    """Test reading the running totals"""
+
+    def test_seeded_total_is_one_point_read(self, table):
+        """A backfilled TOTAL item is returned as is"""
+        table.get_item.return_value = {
+            "Item": {"amount": Decimal("12.5"), "seeded": True}
+        }
+        service = DynamoDBService(table)
+
+        assert service.get_total_spent("child1") == 12.5
+        table.query.assert_not_called()
+
+    def test_unseeded_total_sums_history_without_writing(self, table):
+        """Before the backfill, reads sum the history and store nothing"""
+        table.get_item.return_value = {"Item": {"amount": Decimal("1")}}
+        table.query.return_value = {
+            "Items": [{"amount": Decimal("1")}, {"amount": Decimal("4.5")}]
+        }
+        service = DynamoDBService(table)
+
+        assert service.get_total_spent("child1") == 5.5
+        table.put_item.assert_not_called()
+        table.update_item.assert_not_called()
+
+
+class TestBackfillTotals:
+    """Test seeding TOTAL items from history"""
+
+    HISTORY = {"Items": [{"amount": Decimal("2")}, {"amount": Decimal("3")}]}
+
+    def test_seeds_missing_total(self, table):
+        """A child without a TOTAL item gets one with its full history"""
+        table.get_item.return_value = {}
+        table.query.return_value = self.HISTORY
+        service = DynamoDBService(table)
+
+        assert service.backfill_totals(["child1"]) == {"child1": 5.0}
+
+        kwargs = table.put_item.call_args.kwargs
+        assert kwargs["Item"] == {
+            "pk": "CHILD#child1",
+            "sk": "TOTAL",
+            "amount": Decimal("5"),
+            "expenditure_count": 2,
+            "seeded": True,
+        }
+        assert kwargs["ConditionExpression"] == "attribute_not_exists(pk)"
+        assert table.query.call_args.kwargs["ConsistentRead"] is True
+
+    def test_seed_conditioned_on_write_count(self, table):
+        """A TOTAL created by live ADDs is replaced only if no write raced"""
+        table.get_item.return_value = {"Item": {"expenditure_count": 1}}
+        table.query.return_value = self.HISTORY
+        service = DynamoDBService(table)
+
+        service.backfill_totals(["child1"])
+
+        kwargs = table.put_item.call_args.kwargs
+        assert kwargs["ConditionExpression"] == "expenditure_count = :seen"
+        assert kwargs["ExpressionAttributeValues"] == {":seen": 1}
+
+    def test_retries_when_a_write_lands_during_backfill(self, table):
+        """The sum is redone after a concurrent write moves the count"""
+        table.get_item.side_effect = [
+            {"Item": {"expenditure_count": 1}},
+            {"Item": {"expenditure_count": 2}},
+        ]
+        table.query.return_value = self.HISTORY
+        table.put_item.side_effect = [ConditionalCheckFailedException(), {}]
+        service = DynamoDBService(table)
+
+        assert service.backfill_totals(["child1"]) == {"child1": 5.0}
+        assert table.put_item.call_args.kwargs["ExpressionAttributeValues"] == {
+            ":seen": 2
+        }
+
+    def test_defaults_to_children_with_expenditures(self, table):
+        """Without names, every child with an EXPENDITURE# item is seeded"""
+        table.get_item.return_value = {}
+        # Scanned rather than read from the GSI, so untagged legacy items count
+        table.scan.side_effect = [
+            {"Items": [{"pk": "CHILD#child2"}], "LastEvaluatedKey": {"pk": "x"}},
+            {"Items": [{"pk": "CHILD#child1"}, {"pk": "CHILD#child2"}]},
+        ]
+        table.query.side_effect = [
+            {"Items": [{"amount": Decimal("2")}]},
+            {"Items": [{"amount": Decimal("1")}]},
+        ]
+        service = DynamoDBService(table)
+
+        assert service.backfill_totals() == {"child1": 2.0, "child2": 1.0}
+        scan = table.scan.call_args_list[0].kwargs
+        assert scan["FilterExpression"] == "begins_with(sk, :sk)"
+        assert scan["ExpressionAttributeValues"] == {":sk": "EXPENDITURE#"}
+        assert all("IndexName" not in c.kwargs for c in table.query.call_args_list)
+
+
+class TestBackfillRecordTypes:
+    """Test tagging legacy expenditures for the record_type GSI"""
+
+    def test_tags_untagged_expenditures_across_pages(self, table):
+        """Every untagged EXPENDITURE# item found by the scan gets record_type"""
+        first = {"pk": "CHILD#child1", "sk": "EXPENDITURE#2024-01-01T00:00:00"}
+        second = {"pk": "CHILD#child2", "sk": "EXPENDITURE#2024-02-01T00:00:00"}
+        table.scan.side_effect = [
+            {"Items": [first], "LastEvaluatedKey": first},
+            {"Items": [second]},
+        ]
+        service = DynamoDBService(table)
+
+        assert service.backfill_record_types() == 2
+
+        scan = table.scan.call_args_list[0].kwargs
+        assert "attribute_not_exists(record_type)" in scan["FilterExpression"]
+        assert scan["ExpressionAttributeValues"] == {":sk": "EXPENDITURE#"}
+        assert table.scan.call_args_list[1].kwargs["ExclusiveStartKey"] == first
+        keys = [call.kwargs["Key"] for call in table.update_item.call_args_list]
+        assert keys == [first, second]
+        update = table.update_item.call_args.kwargs
+        assert update["ExpressionAttributeValues"] == {":type": "expenditure"}
+        assert update["ConditionExpression"] == "attribute_exists(pk)"
+
+    def test_items_deleted_since_the_scan_are_skipped(self, table):
+        """An item gone by the time of its update is not recreated"""
+        table.scan.return_value = {
+            "Items": [{"pk": "CHILD#child1", "sk": "EXPENDITURE#2024-01-01"}]
+        }
+        table.update_item.side_effect = ConditionalCheckFailedException()
+        service = DynamoDBService(table)
+
+        assert service.backfill_record_types() == 0
@@ -0,0 +1,118 @@
+"""Tests for the calculation and expenditure handlers"""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from handlers.calculations import calculate_totals, invalidate_totals
+from handlers.expenditures import post_expenditures
+
+
+@pytest.fixture(autouse=True)
+def clear_totals_cache():
+    """Each test starts with no cached totals"""
+    invalidate_totals()
+    yield
+    invalidate_totals()
+
+
+@pytest.fixture
+def sheets_service():
+    """Stub Sheets service returning one allowance row for child1"""
+    service = Mock()
+    service.get_allowance_data.return_value = [
+        {"Before Today": True, "child1": 20, "child2": 0, "child3": 0}
+    ]
+    with (
+        patch("handlers.calculations.get_sheets_service", return_value=service),
+        patch("handlers.expenditures.get_sheets_service", return_value=service),
+    ):
+        yield service
+
+
+def _table():
+    table = Mock()
+    table.get_item.return_value = {"Item": {"amount": Decimal("5"), "seeded": True}}
+    return table
+
+
+class TestCalculateTotals:
+    """Test the cached totals calculation"""
+
+    def test_totals_from_sheet_and_table(self, sheets_service):
+        """Earned comes from the sheet, spent from the TOTAL items"""
+        totals = calculate_totals(table=_table())
+
+        assert totals["child1"] == {"earned": 20, "spent": 5.0, "balance": 15.0}
+        assert totals["child2"]["balance"] == -5.0
+
+    def test_totals_cached_for_explicit_table(self, sheets_service):
+        """Callers passing their own table handle still hit the cache"""
+        table = _table()
+
+        first = calculate_totals(table=table)
+        second = calculate_totals(table=table)
+
+        assert second is first
+        assert table.get_item.call_count == 3
+        sheets_service.get_allowance_data.assert_called_once()
+
+    def test_invalidate_totals_forces_recompute(self, sheets_service):
+        """invalidate_totals drops cached totals for every table"""
+        table = _table()
+
+        calculate_totals(table=table)
+        invalidate_totals()
+        calculate_totals(table=table)
+
+        assert table.get_item.call_count == 6
+
+
+class TestPostExpenditures:
+    """Test bulk expenditure posting"""
+
+    EXPENDITURES = [
+        ("child1", 1.5, "2025-01-01", "Candy"),
+        ("child2", 3, "2025-01-02", "Book"),
+    ]
+
+    def test_posts_to_sheets_and_table(self, sheets_service):
+        """One Sheets append and one bulk DynamoDB save"""
+        sheets_service.add_expenditures.return_value = True
+        db_service = Mock()
+        db_service.save_expenditures.return_value = True
+
+        with patch("handlers.expenditures.DynamoDBService", return_value=db_service):
+            assert post_expenditures(iter(self.EXPENDITURES), table=Mock())
+
+        sheets_service.add_expenditures.assert_called_once_with(self.EXPENDITURES)
+        db_service.save_expenditures.assert_called_once_with(self.EXPENDITURES)
+
+    def test_invalidates_cached_totals(self, sheets_service):
+        """Posting drops the cached totals so the new spend shows up"""
+        sheets_service.add_expenditures.return_value = True
+        table = _table()
+
+        calculate_totals(table=table)
+        post_expenditures(self.EXPENDITURES, table=table)
+        calculate_totals(table=table)
+
+        assert sheets_service.get_allowance_data.call_count == 2
+
+    def test_partial_failure_returns_false(self, sheets_service):
+        """A failed Sheets append fails the post even if DynamoDB succeeded"""
+        sheets_service.add_expenditures.return_value = False
+        db_service = Mock()
+        db_service.save_expenditures.return_value = True
+
+        with patch("handlers.expenditures.DynamoDBService", return_value=db_service):
+            assert not post_expenditures(self.EXPENDITURES, table=Mock())
+
+    def test_exception_returns_false(self, sheets_service):
+        """Errors from either store are reported rather than raised"""
+        sheets_service.add_expenditures.side_effect = RuntimeError("quota")
+        db_service = Mock()
+
+        with patch("handlers.expenditures.DynamoDBService", return_value=db_service):
+            assert not post_expenditures(self.EXPENDITURES, table=Mock())
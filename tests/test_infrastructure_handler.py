@@ -0,0 +1,70 @@
+"""Test the API Gateway handler in infrastructure/lambda_function.py"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from infrastructure import lambda_function
+
+
+def _post(body):
+    return {
+        "httpMethod": "POST",
+        "body": json.dumps(body),
+        "requestContext": {"identity": {"userArn": "arn:aws:iam::1:user/test"}},
+    }
+
+
+@pytest.fixture(autouse=True)
+def authorized():
+    with patch.object(lambda_function, "is_authorized", return_value=True):
+        yield
+
+
+class TestBulkPost:
+    """Test posting several expenditures in one request"""
+
+    def test_expenditures_posted_in_bulk(self):
+        """The batch goes to post_expenditures as ordered tuples"""
+        body = {
+            "expenditures": [
+                {
+                    "child_name": "child1",
+                    "amount": 1.5,
+                    "date": "2025-01-01",
+                    "description": "Candy",
+                },
+                {"child_name": "child2", "amount": 3, "description": "Book"},
+            ]
+        }
+        with patch.object(
+            lambda_function, "post_expenditures", return_value=True
+        ) as post:
+            response = lambda_function.lambda_handler(_post(body), None)
+
+        assert response["statusCode"] == 200
+        post.assert_called_once_with(
+            [
+                ("child1", 1.5, "2025-01-01", "Candy"),
+                ("child2", 3, None, "Book"),
+            ]
+        )
+
+    def test_failed_bulk_post_returns_500(self):
+        with patch.object(lambda_function, "post_expenditures", return_value=False):
+            response = lambda_function.lambda_handler(
+                _post({"expenditures": [{"child_name": "child1", "amount": 1}]}),
+                None,
+            )
+
+        assert response["statusCode"] == 500
+
+    @pytest.mark.parametrize("batch", [{"child_name": "child1"}, ["child1"]])
+    def test_malformed_batch_rejected(self, batch):
+        with patch.object(lambda_function, "post_expenditures") as post:
+            response = lambda_function.lambda_handler(
+                _post({"expenditures": batch}), None
+            )
+
+        assert response["statusCode"] == 400
+        post.assert_not_called()
@@ -0,0 +1,76 @@
+"""Test the AWS Lambda handler wrapper"""
+
+import json
+import re
+from types import SimpleNamespace
+
+import lambda_function
+import pytest
+
+
+def _event(method="GET", path="/health"):
+    return {
+        "httpMethod": method,
+        "path": path,
+        "headers": {"User-Agent": "pytest"},
+        "requestContext": {},
+    }
+
+
+class TestLambdaHandler:
+    """Test the Mangum wrapper around the FastAPI app"""
+
+    @pytest.fixture
+    def context(self):
+        return SimpleNamespace(
+            aws_request_id="req-123",
+            function_name="child-allowance-tracker",
+        )
+
+    def test_successful_request(self, context, monkeypatch):
+        """Test that the Mangum response is returned unchanged"""
+        response = {"statusCode": 200, "body": '{"status":"healthy"}'}
+        monkeypatch.setattr(lambda_function, "handler", lambda e, c: response)
+
+        assert lambda_function.lambda_handler(_event(), context) is response
+
+    def test_exception_returns_500(self, context, monkeypatch):
+        """Test that unhandled errors become a JSON 500 response"""
+
+        def boom(event, context):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(lambda_function, "handler", boom)
+
+        response = lambda_function.lambda_handler(_event(), context)
+
+        assert response["statusCode"] == 500
+        assert response["headers"]["Content-Type"] == "application/json"
+        body = json.loads(response["body"])
+        assert body["error"] == "Internal Server Error"
+        assert body["error_id"] == "error_req-123"
+        assert re.fullmatch(
+            r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z", body["timestamp"]
+        )
+
+    def test_error_cors_echoes_allowed_origin(self, context, monkeypatch):
+        """Test that error responses only allow origins the app allows"""
+
+        def boom(event, context):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(lambda_function, "handler", boom)
+        monkeypatch.setattr(
+            lambda_function, "_ALLOWED_ORIGINS", frozenset({"https://app.example.com"})
+        )
+
+        allowed = _event()
+        allowed["headers"]["origin"] = "https://app.example.com"
+        headers = lambda_function.lambda_handler(allowed, context)["headers"]
+        assert headers["Access-Control-Allow-Origin"] == "https://app.example.com"
+        assert headers["Access-Control-Allow-Credentials"] == "true"
+
+        other = _event()
+        other["headers"]["origin"] = "https://evil.example.com"
+        headers = lambda_function.lambda_handler(other, context)["headers"]
+        assert "Access-Control-Allow-Origin" not in headers
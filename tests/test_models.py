@@ -142,3 +142,37 @@ def test_child_add_expenditure():
         assert child.expenditures[0] == expenditure
     else:
         pytest.skip("Child model doesn't have add_expenditure method")
+
+
+def test_models_use_slots():
+    """Test that model instances are slotted and total with fsum"""
+    if not SEPARATE_MODELS_AVAILABLE:
+        pytest.skip("Separate models not available")
+
+    child = ModelChild(name="Eve", total_earnings=10)
+    for _ in range(10):
+        child.add_expenditure(Expenditure(amount=0.1, description="Gum"))
+
+    assert not hasattr(child, "__dict__")
+    assert not hasattr(child.expenditures[0], "__dict__")
+    assert child.get_total_spent() == 1.0
+    assert child.get_balance() == 9.0
+
+
+def test_total_spent_sees_direct_appends():
+    """Test that totals follow the expenditures list however it is changed"""
+    if not SEPARATE_MODELS_AVAILABLE:
+        pytest.skip("Separate models not available")
+
+    with pytest.raises(TypeError):
+        ModelChild("Eve", 10, [Expenditure(3, "Book")])
+
+    child = ModelChild(name="Eve", total_earnings=10)
+    child.add_expenditure(Expenditure(amount=2.0, description="Gum"))
+    child.expenditures.append(Expenditure(amount=3.0, description="Book"))
+
+    assert child.get_total_spent() == 5.0
+    assert child.get_balance() == 5.0
+
+    child.expenditures.pop()
+    assert child.get_total_spent() == 2.0